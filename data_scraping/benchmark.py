@@ -0,0 +1,208 @@
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import resource   # Peak RSS; Unix only
+except ImportError:
+    resource = None
+
+from engine import CrawlEngine
+from mock_server import LISTING_ITEM, MockNewsServer
+from parsers import cached_pages, sample_pages
+from sites import SITES
+
+# ==========================================
+# ⏱️ OFFLINE SCRAPER BENCHMARK
+# ==========================================
+# Runs each site's crawler end-to-end against a local MockNewsServer instead
+# of the live outlets, so throughput regressions show up without touching
+# rappler.com & co. Article pages are recorded fixtures (cached responses
+# from http_cache/ plus real dataset rows wrapped in article markup), the 403
+# body is the Deflect page saved in debug_source.html, and the server adds
+# latency / 403s / 503s on request.
+#
+# Every site runs in its own subprocess so CPU time and peak RSS are per site.
+#
+#   python benchmark.py                               # all sites, default faults
+#   python benchmark.py --site Rappler --latency 0.2 --block-rate 0.05
+#   python benchmark.py --save bench.json             # record a baseline
+#   python benchmark.py --compare bench.json          # flag >10% regressions
+#
+# The Selenium VeraFiles scraper (verafiles.py) needs a real Chrome and isn't
+# covered; "Vera Files" here is the cloudscraper engine (verafiles2.py).
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEBUG_SOURCE = os.path.join(HERE, "..", "debug_source.html")
+
+# Listing markup each spec's header_tags / anchors filter expects
+LISTING_ITEMS = {
+    "MindaNews": '<h2 class="entry-title"><a href="{href}">{title}</a></h2>',
+}
+
+
+def load_fixtures(limit=200):
+    pages = [body for url, body in cached_pages(os.path.join(HERE, "http_cache")) if "/page/" not in url]
+    for csv_path in glob.glob(os.path.join(HERE, "..", "*_Full_Dataset.csv")):
+        pages.extend(html for _, html in sample_pages(csv_path, limit=limit))
+    return pages
+
+
+def bench_spec(spec, base, rate, cooldown, pages):
+    # Same selectors / filters / extraction, pointed at the mock server
+    bench = dict(spec)
+    bench.update({
+        "sections": {"fake": [base + "/fact-check/"], "true": [base + "/news/"]},
+        "must_contain": {},
+        "requests_per_second": rate,
+        "max_requests_per_second": rate * 4,
+        "blocked_wait": cooldown,
+        "max_pages": pages,
+    })
+    if "href_prefix" in spec:
+        bench["href_prefix"] = base + "/"
+    if bench["client"] == "browser":
+        bench["client"] = "requests"
+    return bench
+
+
+def percentile(values, q):
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100)[q - 1]
+
+
+def run_site(name, args):
+    block_page = open(DEBUG_SOURCE, encoding="utf-8").read() if os.path.exists(DEBUG_SOURCE) else None
+    server = MockNewsServer(
+        articles_per_page=args.per_page, pages=args.pages,
+        latency=args.latency, jitter=args.jitter,
+        block_rate=args.block_rate, error_rate=args.error_rate, block_page=block_page,
+        fixtures=load_fixtures(), listing_item=LISTING_ITEMS.get(name, LISTING_ITEM),
+        sections=("fact-check", "news"),
+    )
+    base = server.start()
+    latencies = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        spec = bench_spec(SITES[name], base, args.rate, args.cooldown, args.pages)
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine = CrawlEngine(spec, max_workers=args.workers, cache_dir=os.path.join(tmp, "cache"))
+
+        get = engine.session.get
+        def timed_get(*a, **kw):
+            # Don't touch .content: streamed article bodies are read (and cut short) by the engine
+            start = time.perf_counter()
+            response = get(*a, **kw)
+            latencies.append(time.perf_counter() - start)
+            return response
+        engine.session.get = timed_get
+
+        cpu_before = os.times()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            counts = engine.run_full_scrape(args.target, os.path.join(tmp, "rows.jsonl"))
+        seconds = time.perf_counter() - start
+        cpu_after = os.times()
+    server.stop()
+
+    # Parse workers are reaped by pipeline.close(), so their CPU shows up in children_*
+    cpu = sum(getattr(cpu_after, f) - getattr(cpu_before, f)
+              for f in ("user", "system", "children_user", "children_system"))
+    articles = sum(counts.values())
+    result = {
+        "site": name,
+        "articles": articles,
+        "seconds": round(seconds, 3),
+        "articles_per_sec": round(articles / seconds, 2) if seconds else 0.0,
+        "requests": len(latencies),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "cpu_seconds": round(cpu, 3),
+        "mb_transferred": round(engine.metrics.total("bytes_total") / 1e6, 2),
+        "statuses": {str(k): v for k, v in sorted(server.served.items())},
+    }
+    if resource:
+        # ru_maxrss is KB on Linux
+        result["peak_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+        result["worker_peak_rss_mb"] = round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1)
+    return result
+
+
+def print_table(results):
+    print(f"\n{'Site':<13}{'Articles':>9}{'Art/s':>8}{'p50 ms':>9}{'p99 ms':>9}{'CPU s':>8}{'RSS MB':>8}  Statuses")
+    for r in results:
+        print(f"{r['site']:<13}{r['articles']:>9}{r['articles_per_sec']:>8}{r['p50_ms']:>9}{r['p99_ms']:>9}"
+              f"{r['cpu_seconds']:>8}{r.get('peak_rss_mb', '-'):>8}  {r['statuses']}")
+
+
+def compare(results, baseline_path, tolerance=0.10):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {r["site"]: r for r in json.load(f)}
+    regressions = []
+    for r in results:
+        old = baseline.get(r["site"])
+        if not old: continue
+        if r["articles_per_sec"] < old["articles_per_sec"] * (1 - tolerance):
+            regressions.append(f"{r['site']}: {old['articles_per_sec']} -> {r['articles_per_sec']} articles/s")
+        if r["cpu_seconds"] > old["cpu_seconds"] * (1 + tolerance):
+            regressions.append(f"{r['site']}: CPU {old['cpu_seconds']} -> {r['cpu_seconds']} s")
+    for line in regressions:
+        print(f"   ⚠️  Regression: {line}")
+    if not regressions:
+        print(f"   ✅ No regressions against {baseline_path}")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scrapers against a local mock news site")
+    parser.add_argument("--site", action="append", choices=sorted(SITES), help="repeatable; default: all")
+    parser.add_argument("--target", type=int, default=40, help="articles per class")
+    parser.add_argument("--pages", type=int, default=12)
+    parser.add_argument("--per-page", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rate", type=float, default=50.0, help="starting requests/second per host")
+    parser.add_argument("--cooldown", type=float, default=0.5, help="throttle cooldown after a 403/503")
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.05)
+    parser.add_argument("--block-rate", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.02)
+    parser.add_argument("--save", help="write results as JSON")
+    parser.add_argument("--compare", help="baseline JSON from an earlier --save")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.child:
+        print(json.dumps(run_site(args.site[0], args)))
+        sys.exit(0)
+
+    results = []
+    for name in args.site or sorted(SITES):
+        print(f"⏱️  Benchmarking {name}...")
+        child_args = [f"--{k.replace('_', '-')}={v}" for k, v in vars(args).items()
+                      if k not in ("site", "save", "compare", "child")]
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", "--site", name] + child_args,
+                             capture_output=True, text=True, cwd=HERE)
+        if out.returncode != 0:
+            print(f"   ❌ {name} failed:\n{out.stderr[-2000:]}")
+            continue
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    print_table(results)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Saved results to {args.save}")
+    if args.compare:
+        sys.exit(1 if compare(results, args.compare) else 0)
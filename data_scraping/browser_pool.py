@@ -0,0 +1,102 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+# ==========================================
+# 🌐 SELENIUM BROWSER POOL
+# ==========================================
+# One Chrome handles one page at a time, so the VeraFiles scraper was capped
+# at a single article per page-load. This keeps N reusable WebDriver sessions
+# and feeds them article URLs from a work queue.
+#
+# A driver that raises (crash, hung page-load timeout, dead session) is quit
+# and replaced by a fresh one, and the URL is retried once; the run carries on.
+# Drivers are also recycled after `max_uses` pages to keep Chrome's memory flat.
+
+
+class BrowserPool:
+    def __init__(self, make_driver, size=3, max_uses=200):
+        self.make_driver = make_driver
+        self.size = size
+        self.max_uses = max_uses
+        self.idle = queue.Queue()
+        self.uses = {}
+        self.lock = threading.Lock()
+        self.recycled = 0
+        self.executor = ThreadPoolExecutor(max_workers=size)
+
+    def _acquire(self):
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            driver = self.make_driver()
+            with self.lock:
+                self.uses[id(driver)] = 0
+            return driver
+
+    def _quit(self, driver):
+        with self.lock:
+            self.uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _release(self, driver, broken=False):
+        with self.lock:
+            self.uses[id(driver)] = self.uses.get(id(driver), 0) + 1
+            worn_out = self.uses[id(driver)] >= self.max_uses
+        if broken or worn_out:
+            if broken:
+                self.recycled += 1
+            self._quit(driver)
+        else:
+            self.idle.put(driver)
+
+    def run(self, task, item, retries=1):
+        # task(driver, item) -> result. Returns None if every attempt failed.
+        for attempt in range(retries + 1):
+            try:
+                driver = self._acquire()
+            except Exception as e:
+                print(f"      ❌ Could not start a browser: {e}")
+                return None
+            try:
+                result = task(driver, item)
+            except Exception as e:
+                print(f"      ♻️  Browser failed on {item} ({type(e).__name__}). Recycling driver...")
+                self._release(driver, broken=True)
+                continue
+            self._release(driver)
+            return result
+        return None
+
+    def map(self, task, items):
+        # Yield (item, result) as pages finish, keeping every driver busy.
+        # Stop iterating whenever you like; queued work is cancelled.
+        items = iter(items)
+        pending = {}
+        try:
+            for item in items:
+                pending[self.executor.submit(self.run, task, item)] = item
+                if len(pending) >= self.size:
+                    break
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    for nxt in items:
+                        pending[self.executor.submit(self.run, task, nxt)] = nxt
+                        break
+                    yield item, future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def close(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        while True:
+            try:
+                self._quit(self.idle.get_nowait())
+            except queue.Empty:
+                break
@@ -0,0 +1,92 @@
+import json
+import os
+import threading
+
+# ==========================================
+# 💾 RESUMABLE CRAWL CHECKPOINTS
+# ==========================================
+# Append-only JSON-lines log. Every accepted row, every rejected URL and the
+# current (source URL, page) cursor are written as they happen, so a crash at
+# article 2,900 resumes from the same listing page instead of page 1 (no more
+# hand-made VeraFiles_Backup.csv copies).
+#
+#   {"kind": "row",    "category": "fake", "row": {...}}
+#   {"kind": "seen",   "category": "fake", "url": "..."}
+#   {"kind": "cursor", "category": "fake", "source": "...", "page": 7}
+
+
+class CheckpointStore:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.rows_by_category = {}
+        self.seen_by_category = {}
+        self.cursors = {}
+        if path and os.path.exists(path):
+            self._load()
+
+    def _load(self):
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Half-written last line from a crash
+                category = entry.get("category")
+                if entry.get("kind") == "row":
+                    self.rows_by_category.setdefault(category, []).append(entry["row"])
+                elif entry.get("kind") == "seen":
+                    self.seen_by_category.setdefault(category, set()).add(entry["url"])
+                elif entry.get("kind") == "cursor":
+                    self.cursors[category] = (entry["source"], entry["page"])
+        total = sum(len(r) for r in self.rows_by_category.values())
+        print(f"   💾 Checkpoint {self.path}: {total} rows restored")
+
+    def _append(self, entry):
+        if not self.path:
+            return
+        with self.lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    # --- Restore ---
+    def rows(self, category):
+        return list(self.rows_by_category.get(category, []))
+
+    def seen(self, category):
+        return set(self.seen_by_category.get(category, set()))
+
+    def cursor(self, category):
+        return self.cursors.get(category)
+
+    def restore(self, category, seen_urls):
+        # Rows collected so far; their URLs (and rejected ones) go back into the dedup index.
+        # Handed over once: the caller streams them to its dataset sink, we stop holding them.
+        rows = self.rows_by_category.pop(category, [])
+        for url in [r["url"] for r in rows] + sorted(self.seen(category)):
+            seen_urls.add(url)
+        if rows:
+            print(f"   💾 Resuming '{category}' with {len(rows)} rows already collected")
+        return rows
+
+    def resume_point(self, category, url_list):
+        # -> (index of the source to start from, page to start on)
+        cur = self.cursor(category)
+        if cur and cur[0] in url_list:
+            return url_list.index(cur[0]), cur[1]
+        return 0, 1
+
+    # --- Record ---
+    def record_row(self, category, row):
+        # On disk only; rows_by_category is just what _load() found for restore()
+        self._append({"kind": "row", "category": category, "row": row})
+
+    def record_seen(self, category, url):
+        self.seen_by_category.setdefault(category, set()).add(url)
+        self._append({"kind": "seen", "category": category, "url": url})
+
+    def record_cursor(self, category, source, page):
+        self.cursors[category] = (source, page)
+        self._append({"kind": "cursor", "category": category, "source": source, "page": page})
@@ -0,0 +1,69 @@
+import sys
+
+from dataset_writer import HAS_PYARROW, format_for
+
+if HAS_PYARROW:
+    import pyarrow as pa
+    import pyarrow.csv
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+
+# ==========================================
+# 📦 MEMORY-MAPPED DATASET LOADER
+# ==========================================
+# Training experiments used to pd.read_csv the whole quoted CSV every run.
+# This opens the columnar outputs (see dataset_writer.py) instead:
+#
+#   .arrow    memory-mapped, zero-copy: `text` is read straight from the page
+#             cache, nothing is parsed or copied until you touch it
+#   .parquet  memory-mapped file, decompressed column by column
+#   .csv      still works (parsed by Arrow's multithreaded CSV reader)
+#
+#   table = load_table("Rappler_Full_Dataset.arrow", columns=["text", "label"])
+#   texts = table.column("text")      # pyarrow ChunkedArray, no copy
+#   df = table.to_pandas()            # only if you really want pandas
+#
+# Convert an existing CSV (keeps CSV as an export option, nothing is removed):
+#
+#   python dataset_loader.py Rappler_Full_Dataset.csv Rappler_Full_Dataset.arrow
+
+
+def load_table(path, columns=None):
+    if not HAS_PYARROW:
+        raise ImportError("The columnar loader needs `pip install pyarrow`")
+    fmt = format_for(path)
+    if fmt == "arrow":
+        # No `with`: the table's buffers point into the mapping, it must outlive this call
+        table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+        return table.select(columns) if columns else table
+    if fmt == "parquet":
+        return pq.read_table(path, columns=columns, memory_map=True)
+    if fmt == "csv":
+        # Same BOM the old to_csv(encoding="utf-8-sig") calls wrote; Arrow strips it
+        options = pa.csv.ConvertOptions(include_columns=columns)
+        return pa.csv.read_csv(path, convert_options=options)
+    raise ValueError(f"load_table can't read {fmt} files; use dataset_writer.read_rows")
+
+
+def iter_texts(path, batch_size=1024):
+    # Batches of article text for tokenizers / feature extractors, never the whole column at once
+    table = load_table(path, columns=["text"])
+    for batch in table.to_batches(max_chunksize=batch_size):
+        yield batch.column(0).to_pylist()
+
+
+def convert(src, dst):
+    # Any readable format -> any writable one, streamed (no shuffle, see postprocess.py for that)
+    from dataset_writer import DatasetWriter, read_rows
+
+    with DatasetWriter(dst, batch_size=1000) as sink:
+        sink.write_many(read_rows(src))
+    return sink.count
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python dataset_loader.py <input .csv/.jsonl/.parquet/.arrow> <output file>")
+        sys.exit(1)
+    n = convert(sys.argv[1], sys.argv[2])
+    print(f"🎉 Converted {n} rows: {sys.argv[1]} -> {sys.argv[2]}")
@@ -0,0 +1,177 @@
+import csv
+import json
+import os
+import threading
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# ==========================================
+# 📝 STREAMING DATASET WRITER
+# ==========================================
+# Rows go to disk as they are accepted instead of piling up in a list that is
+# turned into a DataFrame, concat'ed and shuffled at the very end (which held
+# every article's text in RAM several times over). Rows are buffered in small
+# batches; each batch is appended, flushed and fsync'ed, so a crash loses at
+# most one batch (and the checkpoint still has those rows).
+#
+#   with DatasetWriter("rappler_rows.jsonl") as sink:
+#       sink.write(row)
+#
+# Format follows the extension: .csv (UTF-8-SIG, like the old to_csv calls),
+# .jsonl, .parquet (zstd, one row group per batch) or .arrow (Arrow IPC file,
+# uncompressed so dataset_loader.py can memory-map it). The columnar formats
+# need `pip install pyarrow` and store label / category / source dictionary-
+# encoded: a handful of distinct strings, stored once, plus small int codes.
+# Shuffling / balancing is a separate pass, see postprocess.py.
+
+COLUMNS = ["text", "label", "category", "title", "url", "source"]
+DICTIONARY_COLUMNS = ("label", "category", "source")
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".json": "jsonl", ".parquet": "parquet",
+           ".arrow": "arrow", ".feather": "arrow"}
+COLUMNAR_FORMATS = ("parquet", "arrow")
+
+
+def format_for(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in FORMATS:
+        raise ValueError(f"Unknown dataset format for {path} (use .csv, .jsonl or .parquet)")
+    return FORMATS[ext]
+
+
+def arrow_schema(columns=COLUMNS):
+    return pa.schema([
+        (c, pa.dictionary(pa.int32(), pa.string()) if c in DICTIONARY_COLUMNS else pa.string())
+        for c in columns
+    ])
+
+
+class DictionaryEncoder:
+    # Codes stay stable across batches: each batch's dictionary only ever grows
+    # at the end, which is what Arrow IPC files accept (dictionary deltas).
+    def __init__(self):
+        self.values = []
+        self.codes = {}
+
+    def encode(self, column):
+        indices = []
+        for value in column:
+            if value is None:
+                indices.append(None)
+                continue
+            if value not in self.codes:
+                self.codes[value] = len(self.values)
+                self.values.append(value)
+            indices.append(self.codes[value])
+        return pa.DictionaryArray.from_arrays(pa.array(indices, type=pa.int32()),
+                                              pa.array(self.values, type=pa.string()))
+
+
+class DatasetWriter:
+    def __init__(self, path, batch_size=50, columns=COLUMNS):
+        self.path = path
+        self.format = format_for(path)
+        self.batch_size = batch_size
+        self.columns = list(columns)
+        self.batch = []
+        self.count = 0
+        self.lock = threading.Lock()
+        self.file = None
+        self.arrow = None
+
+        if self.format in COLUMNAR_FORMATS:
+            if not HAS_PYARROW:
+                raise ImportError(f"{self.format} output needs `pip install pyarrow`")
+            self.schema = arrow_schema(self.columns)
+            self.encoders = {c: DictionaryEncoder() for c in self.columns if c in DICTIONARY_COLUMNS}
+            if self.format == "parquet":
+                self.arrow = pq.ParquetWriter(path, self.schema, compression="zstd")
+            else:
+                self.arrow = pa.ipc.new_file(path, self.schema,
+                                             options=pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True))
+        elif self.format == "csv":
+            # utf-8-sig writes the BOM once, at the start of the file
+            self.file = open(path, "w", encoding="utf-8-sig", newline="")
+            self.csv = csv.DictWriter(self.file, fieldnames=self.columns, extrasaction="ignore",
+                                      lineterminator="\n")
+            self.csv.writeheader()
+        else:
+            self.file = open(path, "w", encoding="utf-8")
+
+    def write(self, row):
+        with self.lock:
+            self.batch.append(row)
+            self.count += 1
+            if len(self.batch) >= self.batch_size:
+                self._flush()
+
+    def write_many(self, rows):
+        for row in rows:
+            self.write(row)
+
+    def _flush(self):
+        if not self.batch:
+            return
+        if self.arrow is not None:
+            arrays = []
+            for c in self.columns:
+                column = [r.get(c) for r in self.batch]
+                arrays.append(self.encoders[c].encode(column) if c in self.encoders
+                              else pa.array(column, type=pa.string()))
+            self.arrow.write_batch(pa.record_batch(arrays, schema=self.schema))
+        else:
+            if self.format == "csv":
+                self.csv.writerows(self.batch)
+            else:
+                self.file.writelines(json.dumps(r, ensure_ascii=False) + "\n" for r in self.batch)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+        self.batch = []
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def close(self):
+        with self.lock:
+            self._flush()
+            if self.arrow is not None:
+                self.arrow.close()
+            if self.file is not None:
+                self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_rows(path, batch_size=1000):
+    # Stream rows back as dicts, whatever the format, without loading the file
+    fmt = format_for(path)
+    if fmt == "parquet":
+        if not HAS_PYARROW:
+            raise ImportError("Reading Parquet needs `pip install pyarrow`")
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+            yield from batch.to_pylist()
+    elif fmt == "arrow":
+        if not HAS_PYARROW:
+            raise ImportError("Reading Arrow files needs `pip install pyarrow`")
+        with pa.memory_map(path) as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                yield from reader.get_batch(i).to_pylist()
+    elif fmt == "csv":
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            yield from csv.DictReader(f)
+    else:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
@@ -0,0 +1,57 @@
+import os
+import threading
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# ==========================================
+# 🔁 SHARED URL DEDUPLICATION INDEX
+# ==========================================
+# Replaces the `any(d['url'] == href for d in collected_data)` scans (O(n) per
+# link) with a set lookup on a canonical form of the URL. Optionally backed by
+# a plain text file (one URL per line) so a second run skips articles that an
+# earlier run already harvested.
+
+TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "mc_cid", "mc_eid", "ref", "cmpid", "_ga"}
+
+
+def canonicalize_url(url):
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    # Drop utm_* and friends, keep real params (e.g. ?page=2) in a stable order
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS]
+    path = parts.path.rstrip("/")
+
+    return urlunsplit(("https", host, path, urlencode(sorted(query)), ""))
+
+
+class UrlIndex:
+    def __init__(self, path=None):
+        self.path = path
+        self.urls = set()
+        self.lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.urls.update(line.strip() for line in f if line.strip())
+            print(f"   🔁 Loaded {len(self.urls)} known URLs from {path}")
+
+    def __contains__(self, url):
+        return canonicalize_url(url) in self.urls
+
+    def __len__(self):
+        return len(self.urls)
+
+    def add(self, url):
+        key = canonicalize_url(url)
+        with self.lock:
+            if key in self.urls:
+                return False
+            self.urls.add(key)
+            if self.path:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(key + "\n")
+        return True
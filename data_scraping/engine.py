@@ -0,0 +1,518 @@
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse
+
+from bs4 import BeautifulSoup
+
+from ratelimit import AdaptiveThrottle
+from pipeline import FetchParsePipeline
+from parsers import extract_text
+from textclean import cleaner_for
+from dedup import UrlIndex, canonicalize_url
+from checkpoint import CheckpointStore
+from http_cache import ResponseCache
+from transport import make_session
+from dataset_writer import DatasetWriter
+from feeds import FeedState, is_sitemap, parse_feed, parse_sitemap
+from metrics import Metrics
+from linkfilter import LinkClassifier
+from prequal import ShortPages
+from postprocess import shuffle_dataset
+
+# ==========================================
+# 🕷️ SHARED CRAWL ENGINE
+# ==========================================
+# One implementation of the get_soup / get_full_content / scrape_section /
+# run_full_scrape loop that rappler.py, mindanews.py, pressone.py and
+# verafiles2.py used to copy-paste. Per-site differences live in sites.py;
+# the site modules only keep their target, output file and OPTIONS overrides
+# of SCRAPER_DEFAULTS below, and hand their __main__ to run_scraper().
+
+# ==========================================
+# 👇 SHARED SCRAPER DEFAULTS 👇
+# ==========================================
+SCRAPER_DEFAULTS = {
+    "max_workers": 4,               # Parallel article downloads
+    "parse_workers": None,          # Parser processes (None = one per CPU core)
+    "seen_urls_file": None,         # e.g. "rappler_seen_urls.txt" to skip articles from earlier runs
+    "cache_dir": "http_cache",      # On-disk response cache (shared by all scrapers)
+    "cache_ttl": 7 * 24 * 3600,     # Seconds before a cached page is revalidated
+    "offline": False,               # True = re-parse from cache only, no network at all
+    "listing_prefetch": 2,          # Listing pages fetched ahead while articles download
+    "client": None,                 # None = the spec's; "browser": solve Deflect once in Chrome, then plain HTTP
+    "http2": False,                 # True = HTTP/2 via httpx (pip install httpx[http2]), "requests" client only
+    "metrics_file": None,           # e.g. "rappler_metrics.jsonl": counters / latency histograms every 10 s
+    "metrics_port": None,           # e.g. 9108: Prometheus text endpoint at /metrics
+}
+# ==========================================
+
+
+def site_files(prefix):
+    # Per-site state next to the scripts, e.g. rappler_checkpoint.jsonl
+    return {
+        "checkpoint":   f"{prefix}_checkpoint.jsonl",     # Delete to start from page 1
+        "rows":         f"{prefix}_rows.jsonl",           # Accepted rows are streamed here during the crawl
+        "delta_rows":   f"{prefix}_delta_rows.jsonl",     # `--delta`: only new / updated articles from feeds
+        "delta_state":  f"{prefix}_feed_state.json",      # Last seen <lastmod> per URL
+        "link_cache":   f"{prefix}_link_rejects.json",    # Listing links already rejected, skipped next time
+        "short_pages":  f"{prefix}_short_pages.txt",      # Articles that came out under min_text_len, never refetched
+    }
+
+
+def site_options(prefix, *overrides):
+    # CrawlEngine kwargs for a site module: SCRAPER_DEFAULTS + its state files + overrides (later wins)
+    files = site_files(prefix)
+    options = dict(SCRAPER_DEFAULTS, checkpoint_file=files["checkpoint"],
+                   link_cache_file=files["link_cache"], short_pages_file=files["short_pages"])
+    for layer in overrides:
+        options.update(layer or {})
+    return options
+
+
+def clean_text(text, boilerplate=()):
+    # Compiled once per site and process (textclean.py)
+    return cleaner_for(boilerplate)(text)
+
+
+def extract_article(containers, junk_tags, boilerplate, html):
+    # Runs in a worker process (see pipeline.py), so it must stay module-level
+    return clean_text(extract_text(html, containers, junk_tags=junk_tags), boilerplate)
+
+
+class ListingPrefetcher:
+    # Fetches listing pages a few pages ahead on their own threads, so page N+1
+    # is already downloaded by the time page N's articles are done.
+    def __init__(self, engine, base_url, first_page, depth):
+        self.engine = engine
+        self.base_url = base_url
+        self.depth = depth
+        self.next_page = first_page
+        self.futures = {}
+        self.executor = ThreadPoolExecutor(max_workers=max(depth, 1))
+
+    def get(self, page):
+        last = min(page + self.depth, self.engine.spec["max_pages"])
+        while self.next_page <= last:
+            url = self.engine.page_url(self.base_url, self.next_page)
+            self.futures[self.next_page] = self.executor.submit(self.engine.get_response, url, revalidate=True)
+            self.next_page += 1
+        future = self.futures.pop(page, None)
+        if future is None:
+            return self.engine.get_response(self.engine.page_url(self.base_url, page), revalidate=True)
+        return future.result()
+
+    def close(self):
+        # Source exhausted: drop whatever hasn't started yet
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class CrawlEngine:
+    def __init__(self, spec, max_workers=4, parse_workers=None, seen_urls_file=None,
+                 checkpoint_file=None, cache_dir="http_cache", cache_ttl=7 * 24 * 3600,
+                 offline=False, listing_prefetch=2, client=None, http2=False, pool_sizes=None,
+                 metrics_file=None, metrics_port=None, link_cache_file=None, short_pages_file=None):
+        self.spec = spec
+        self.source = spec["name"]
+        self.urls = spec["sections"]
+        self.max_workers = max_workers
+        self.parse_workers = parse_workers
+        self.listing_prefetch = listing_prefetch
+
+        # Article workers + listing prefetchers can all be on the wire at once
+        self.session = make_session(client or spec["client"], pool_size=max_workers + listing_prefetch,
+                                    pool_sizes=pool_sizes, http2=http2, headers=spec.get("headers"))
+        self.limiter = AdaptiveThrottle(
+            rate=spec["requests_per_second"],
+            burst=spec.get("burst", 1),
+            max_rate=spec.get("max_requests_per_second"),
+            cooldown=spec.get("blocked_wait", 10),
+        )
+        self.seen_urls = UrlIndex(seen_urls_file)
+        self.checkpoint = CheckpointStore(checkpoint_file)
+        self.cache = ResponseCache(cache_dir, ttl=cache_ttl, offline=offline)
+        if not offline:
+            removed = self.cache.evict()
+            if removed: print(f"   🗄️  Evicted {removed} old cache entries from {cache_dir}")
+        self.extract = functools.partial(extract_article, spec["containers"],
+                                         tuple(spec["junk_tags"]), tuple(spec["boilerplate"]))
+        self.metrics = Metrics(metrics_file, prometheus_port=metrics_port)
+        self.links = LinkClassifier(spec, cache_path=link_cache_file, metrics=self.metrics)
+        self.short_pages = ShortPages(short_pages_file)
+
+    # ---------- Fetching ----------
+    def get_response(self, url, containers=None, revalidate=False):
+        # containers: stream the body and stop after the article container (prequal.py)
+        # revalidate: conditional GET even if the cached copy is fresh (listing pages)
+        host = urlparse(url).netloc.lower()
+        metrics = self.metrics
+        for i in range(3):
+            if i: metrics.inc("retries_total", host=host)
+            sent = {}
+            def wait(u):
+                # Politeness wait only happens on real network requests, not cache hits
+                start = time.monotonic()
+                self.limiter.wait(u)
+                sent["at"] = time.monotonic()
+                metrics.observe("throttle_wait_seconds", sent["at"] - start, host=host)
+            started = time.monotonic()
+            try:
+                response = self.cache.fetch(self.session, url, wait=wait, containers=containers,
+                                            revalidate=revalidate, timeout=self.spec.get("timeout", 30))
+            except Exception as e:
+                print(f"      ❌ Connection Error: {e}")
+                metrics.inc("responses_total", host=host, status="error", cache="miss")
+                self.limiter.record(url, None)  # Backs off before the retry
+                continue
+            if response is None: return None # Offline replay miss
+
+            cache = "hit" if "at" not in sent else "miss"
+            metrics.observe("fetch_seconds", time.monotonic() - sent.get("at", started),
+                            host=host, status=response.status_code, cache=cache)
+            metrics.inc("responses_total", host=host, status=response.status_code, cache=cache)
+            if cache == "miss" and not getattr(response, "from_cache", False):   # A 304 sends no body
+                metrics.inc("bytes_total", len(response.content), host=host)
+                if getattr(response, "truncated", False):
+                    metrics.inc("truncated_total", host=host)
+
+            # Feed the throttle (speeds up while healthy, backs off on 403/429/5xx)
+            if "at" in sent:
+                self.limiter.record(url, response.status_code, time.monotonic() - sent["at"],
+                                    response.headers.get("Retry-After"))
+                metrics.set("throttle_rate", round(self.limiter.current_rate(url), 3), host=host)
+
+            if response.status_code == 200:
+                return response
+            if hasattr(response, "close"):
+                response.close()   # A streamed body (prequal.py) holds its pooled connection until closed
+            if response.status_code == 404:
+                return None
+            elif response.status_code in (403, 429):
+                print(f"      ⚠️  Blocked ({response.status_code}) at {url}. Backing off...")
+            else:
+                print(f"      ⚠️  Status {response.status_code} at {url}")
+        return None
+
+    def get_html(self, url, containers=None, revalidate=False):
+        # Network stage only: raw bytes, no parsing on the fetch thread
+        response = self.get_response(url, containers, revalidate)
+        return response.content if response is not None else None
+
+    def get_article(self, url, revalidate=False):
+        # Article bodies stop downloading once the content container is complete
+        return self.get_html(url, self.spec["containers"], revalidate)
+
+    def get_soup(self, url):
+        html = self.get_html(url)
+        if html is None: return None
+        with self.metrics.time("listing_parse_seconds", source=self.source):
+            return BeautifulSoup(html, "html.parser")
+
+    def clean_text(self, text):
+        return clean_text(text, self.spec["boilerplate"])
+
+    def get_full_content(self, url):
+        html = self.get_article(url)
+        if html is None: return ""
+        with self.metrics.time("parse_seconds", source=self.source):
+            return self.extract(html)
+
+    # ---------- Listing pages ----------
+    def page_url(self, base_url, page):
+        if page == 1: return base_url
+        return self.spec["pagination"].format(base=base_url, page=page)
+
+    def listing_links(self, soup, page_url, category_type):
+        spec = self.spec
+        if spec["listing"] == "anchors":
+            links = soup.find_all("a", href=True)
+        else:
+            headers = []
+            for tag, cls in spec["header_tags"]:
+                headers = soup.find_all(tag, class_=cls) if cls else soup.find_all(tag)
+                if headers: break
+            links = [h.find("a", href=True) for h in headers]
+            links = [link for link in links if link]
+
+        # All article links that pass the site filters (seen or not), see linkfilter.py
+        return self.links.filter(((urljoin(page_url, link['href']), link.get_text(strip=True)) for link in links),
+                                 category_type)
+
+    def new_candidates(self, listing):
+        candidates = []
+        page_urls = set()
+        for href, title in listing:
+            if href in self.seen_urls or href in page_urls: continue
+            if href in self.short_pages:
+                # Came out under min_text_len on an earlier run
+                self.metrics.inc("short_pages_skipped_total", source=self.source)
+                continue
+            page_urls.add(href)
+            candidates.append((href, title))
+        return candidates
+
+    def listing_exhausted(self, page, requested_url, response, listing, seen_listings):
+        # Cheap end-of-pagination signals, checked before burning max_empty_pages requests
+        if response is None:
+            return "404 / fetch failed"
+        if page > 1 and canonicalize_url(response.url) != canonicalize_url(requested_url):
+            return "Redirected away (past the last page)"
+        if not listing:
+            return "No article links on page"
+        signature = frozenset(href for href, _ in listing)
+        if signature in seen_listings:
+            return "Same links as an earlier page"
+        seen_listings.add(signature)
+        return None
+
+    # ---------- Crawl loop ----------
+    def count_row(self, category_type, text):
+        if not text: outcome = "failed"
+        elif len(text) < self.spec["min_text_len"]: outcome = "short"
+        else: outcome = "accepted"
+        self.metrics.inc("rows_total", source=self.source, category=category_type, outcome=outcome)
+
+    def make_row(self, text, category_type, title, href):
+        return {
+            "text": text,
+            "label": "Fake" if category_type == "fake" else "True",
+            "category": category_type,
+            "title": title,
+            "url": href,
+            "source": self.source
+        }
+
+    def scrape_section(self, category_type, target_count, sink=None, quota=None):
+        # Accepted rows stream to `sink` (a DatasetWriter) as they arrive. Returns the row count.
+        # quota (a scheduler.Lane) replaces target_count when several sites share one target.
+        print(f"\n🚀 Starting scrape for {self.source.upper()} '{category_type.upper()}'...")
+        spec = self.spec
+        label = "Fake" if category_type == "fake" else "True"
+        restored = self.checkpoint.restore(category_type, self.seen_urls)
+        if sink is not None:
+            sink.write_many(restored)
+        collected = len(restored)
+        if quota is not None:
+            quota.accept(collected)
+        def wanted():
+            return quota.wanted() if quota is not None else collected < target_count
+        def remaining():
+            return quota.remaining() if quota is not None else target_count - collected
+        url_list = self.urls[category_type]
+        start_index, start_page = self.checkpoint.resume_point(category_type, url_list)
+        pipeline = FetchParsePipeline(lambda c: self.get_article(c[0]), self.extract,
+                                      fetch_workers=self.max_workers, parse_workers=self.parse_workers,
+                                      metrics=self.metrics, labels={"source": self.source})
+
+        for source_index, base_url in enumerate(url_list):
+            if source_index < start_index: continue
+            if not wanted(): break
+            print(f"   👉 Source: {base_url}")
+            page = start_page if source_index == start_index else 1
+            consecutive_empty = 0
+            seen_listings = set()
+            prefetcher = ListingPrefetcher(self, base_url, page, self.listing_prefetch)
+
+            while wanted():
+                current_url = self.page_url(base_url, page)
+                self.checkpoint.record_cursor(category_type, base_url, page)
+                response = prefetcher.get(page)
+
+                # 1. Collect candidate links from the listing (cheap, no network)
+                listing = []
+                if response is not None:
+                    with self.metrics.time("listing_parse_seconds", source=self.source):
+                        soup = BeautifulSoup(response.content, "html.parser")
+                        listing = self.listing_links(soup, current_url, category_type)
+                reason = self.listing_exhausted(page, current_url, response, listing, seen_listings)
+                if reason:
+                    print(f"      🛑 {reason}. End of list.")
+                    break
+                candidates = self.new_candidates(listing)
+                found_on_page = 0
+
+                # 2. Fetch bodies on threads, parse them on the process pool
+                results = pipeline.run(candidates, limit=remaining)
+                for (href, title), text in results:
+                    if not wanted(): break
+                    if text and len(text) >= spec["min_text_len"]:
+                        # Class filled while parked: leave the URL unseen for a later run
+                        if quota is not None and not quota.acquire(): break
+                        if not self.seen_urls.add(href):
+                            # The other class's lane (scheduler.py) took it since the listing was read
+                            if quota is not None:
+                                quota.release()
+                            continue
+                        self.count_row(category_type, text)
+                        print(f"      ✅ Added: {title[:40]}... [{label}]")
+                        row = self.make_row(text, category_type, title, href)
+                        if sink is not None:
+                            sink.write(row)
+                        self.checkpoint.record_row(category_type, row)
+                        collected += 1
+                        found_on_page += 1
+                        if quota is not None:
+                            quota.accept()
+                    elif text:
+                        self.seen_urls.add(href)
+                        self.count_row(category_type, text)
+                        self.checkpoint.record_seen(category_type, href)
+                        self.short_pages.record(href, len(text))
+                    else:
+                        self.count_row(category_type, text)
+                results.close()
+
+                target = quota.cap if quota is not None else target_count
+                print(f"      📄 Page {page}: Found {found_on_page} items. (Total: {collected}/{target})")
+
+                if found_on_page == 0:
+                    consecutive_empty += 1
+                else:
+                    consecutive_empty = 0
+
+                if consecutive_empty >= spec["max_empty_pages"]:
+                    print("      ❌ Source exhausted. Moving to next URL...")
+                    break
+                page += 1
+                if page > spec["max_pages"]: break
+            prefetcher.close()
+
+        pipeline.close()
+        self.links.save()
+        print(f"   🔗 Listing links: {self.links.report()}")
+        return collected
+
+    def run_full_scrape(self, samples_per_class, output_file):
+        # Streams both classes into output_file; shuffle afterwards with postprocess.shuffle_dataset
+        with DatasetWriter(output_file) as sink:
+            n_fake = self.scrape_section("fake", target_count=samples_per_class, sink=sink)
+            n_true = self.scrape_section("true", target_count=samples_per_class, sink=sink)
+
+        print("\n" + "="*40)
+        print(f"📊 FINAL {self.source.upper()} COUNTS:")
+        print(f"   🔴 Fake: {n_fake}")
+        print(f"   🟢 True: {n_true}")
+        print(f"   ⏱️  {self.metrics.summary()}")
+        print("="*40)
+        self.metrics.flush()
+
+        return {"fake": n_fake, "true": n_true}
+
+    # ---------- Delta crawl (RSS / Atom / sitemaps) ----------
+    def fetch_feed(self, url):
+        # Feeds must be fresh, so no response cache here; still throttled
+        self.limiter.wait(url)
+        try:
+            response = self.session.get(url, timeout=self.spec.get("timeout", 30))
+        except Exception as e:
+            print(f"      ❌ Feed error at {url}: {e}")
+            self.limiter.record(url, None)
+            return None
+        self.limiter.record(url, response.status_code, retry_after=response.headers.get("Retry-After"))
+        if response.status_code != 200:
+            print(f"      ⚠️  Status {response.status_code} at feed {url}")
+            return None
+        return response.content
+
+    def feed_entries(self, feed_url, state):
+        # -> [(url, title, lastmod)], following sitemap indexes into changed children only
+        content = self.fetch_feed(feed_url)
+        if content is None: return []
+        if not is_sitemap(content):
+            return parse_feed(content)
+        kind, entries = parse_sitemap(content)
+        if kind == "urlset":
+            return [(loc, "", lastmod) for loc, lastmod in entries]
+        found = []
+        for child, lastmod in entries:
+            if not state.changed(child, lastmod): continue  # Nothing new in this child since last run
+            found += self.feed_entries(child, state)
+            state.defer(child, lastmod)
+        return found
+
+    def delta_candidates(self, category_type, state):
+        spec = self.spec
+        must_contain = spec.get("feed_must_contain", {}).get(category_type, "")
+        must_not_contain = spec.get("feed_must_not_contain", {}).get(category_type, [])
+        candidates, lastmods = [], {}
+        for feed_url in spec.get("feeds", {}).get(category_type, []):
+            print(f"   📰 Feed: {feed_url}")
+            for href, title, lastmod in self.feed_entries(feed_url, state):
+                if "href_prefix" in spec and not href.startswith(spec["href_prefix"]): continue
+                if "href_contains_any" in spec and not any(x in href for x in spec["href_contains_any"]): continue
+                if any(x in href for x in spec.get("href_excludes", [])): continue
+                if must_contain and must_contain not in href: continue
+                if any(x in href for x in must_not_contain): continue
+                if href in lastmods: continue
+
+                if href in self.seen_urls and href not in state:
+                    # Harvested by a listing crawl before feeds were tracked: just remember its lastmod
+                    state.mark(href, lastmod)
+                    continue
+                if href in self.seen_urls and not state.changed(href, lastmod): continue
+                lastmods[href] = lastmod
+                candidates.append((href, title or href.rstrip("/").split("/")[-1]))
+        return candidates, lastmods
+
+    def delta_scrape(self, category_type, state, sink=None):
+        # Only new / modified articles from the feeds; returns the row count
+        print(f"\n📰 Delta crawl for {self.source.upper()} '{category_type.upper()}'...")
+        # Everything already harvested (seen-URL file + checkpoint) counts as known
+        for row in self.checkpoint.rows(category_type):
+            self.seen_urls.add(row["url"])
+        for url in self.checkpoint.seen(category_type):
+            self.seen_urls.add(url)
+
+        candidates, lastmods = self.delta_candidates(category_type, state)
+        print(f"      🆕 {len(candidates)} new or updated articles")
+        collected = 0
+        # The feed says these changed: ask the server (conditional GET), never trust a fresh cache entry
+        pipeline = FetchParsePipeline(lambda c: self.get_article(c[0], revalidate=True), self.extract,
+                                      fetch_workers=self.max_workers, parse_workers=self.parse_workers,
+                                      metrics=self.metrics, labels={"source": self.source})
+        for (href, title), text in pipeline.run(candidates):
+            self.count_row(category_type, text)
+            if not text: continue
+            self.seen_urls.add(href)
+            state.mark(href, lastmods[href])
+            if len(text) >= self.spec["min_text_len"]:
+                print(f"      ✅ Added: {title[:40]}... [{category_type}]")
+                row = self.make_row(text, category_type, title, href)
+                if sink is not None:
+                    sink.write(row)
+                self.checkpoint.record_row(category_type, row)
+                collected += 1
+            else:
+                self.checkpoint.record_seen(category_type, href)
+                self.short_pages.record(href, len(text))
+        pipeline.close()
+        state.save()
+        return collected
+
+    def run_delta(self, output_file, state_file):
+        # Daily refresh: new rows go to their own file (merge them with merge_datasets.py)
+        state = FeedState(state_file)
+        with DatasetWriter(output_file) as sink:
+            counts = {c: self.delta_scrape(c, state, sink) for c in self.urls}
+        state.commit()
+        state.save()
+        print(f"\n📊 {self.source.upper()} DELTA: " + ", ".join(f"{c}: {n}" for c, n in counts.items()))
+        print(f"   ⏱️  {self.metrics.summary()}")
+        self.metrics.flush()
+        return counts
+
+
+def run_scraper(scraper, prefix, samples_per_class, output_file, argv=()):
+    # The `python <site>.py [--delta]` entry point every site module shares
+    files = site_files(prefix)
+    if "--delta" in argv:
+        return scraper.run_delta(files["delta_rows"], files["delta_state"])
+
+    counts = scraper.run_full_scrape(samples_per_class, files["rows"])
+    if sum(counts.values()):
+        written = shuffle_dataset(files["rows"], output_file)
+        print(f"\n🎉 SUCCESS! Saved {sum(written.values())} rows to {output_file}")
+        for label, n in written.most_common(): print(f"   {label}: {n}")
+    else:
+        print("\n❌ No data collected.")
+    return counts
@@ -1,7 +1,9 @@
-from datasets import load_dataset
+from filipino_dataset import iter_rows
 
-dataset = load_dataset("jcblaise/fake_news_filipino")
+# Reads the local snapshot (downloaded on first use); see filipino_dataset.py
+# for streaming, memory-mapped Arrow access and exporting it next to the scraped CSVs.
 
-# View a sample
-print(dataset['train'][0])
-# Output: {'label': 0, 'article': '...text...'} (0 usually = Fake, 1 = Real, check documentation)
\ No newline at end of file
+if __name__ == "__main__":
+    # View a sample
+    print(next(iter_rows()))
+    # Output: {'text': '...', 'label': 'Fake', 'category': 'fake', 'title': '', 'url': '', 'source': 'Fake News Filipino'}
@@ -0,0 +1,159 @@
+import os
+import sys
+
+from dataset_writer import COLUMNS, HAS_PYARROW, DatasetWriter
+
+try:
+    import datasets
+    HAS_DATASETS = True
+except ImportError:
+    HAS_DATASETS = False
+
+if HAS_PYARROW:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+# ==========================================
+# 🇵🇭 FAKE NEWS FILIPINO (HUGGING FACE) LOADER
+# ==========================================
+# ff.py used to call load_dataset("jcblaise/fake_news_filipino") at import time,
+# with whatever cache/network the machine happened to have, and its 0/1 labels
+# never matched our Fake/True rows. This downloads the dataset once into a
+# local snapshot (Arrow files, see `python filipino_dataset.py snapshot`) and
+# afterwards only ever reads that snapshot, memory-mapped:
+#
+#   for row in iter_rows():             # our schema: text, label, category, title, url, source
+#       ...
+#   table = load_table()                # pyarrow Table, same schema, `text` zero-copy from the mmap
+#   for row in iter_rows(streaming=True):   # no snapshot yet: stream straight from the Hub
+#       ...
+#
+#   python filipino_dataset.py export Filipino_Fake_News.arrow   # then merge_datasets.py it
+#
+# Nothing touches the network at import time. Set HF_DATASETS_OFFLINE=1 to make
+# sure a missing snapshot fails instead of downloading.
+
+HF_DATASET = "jcblaise/fake_news_filipino"
+SOURCE = "Fake News Filipino"
+SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hf_snapshots", "fake_news_filipino")
+
+# Dataset card: 1 = fake, 0 = real. Only used when the ClassLabel names are bare digits.
+LABELS = {0: "True", 1: "Fake"}
+_NAMED_LABELS = {"fake": "Fake", "real": "True", "true": "True"}
+
+
+def _require():
+    if not HAS_DATASETS:
+        raise ImportError("The Fake News Filipino loader needs `pip install datasets`")
+
+
+def has_snapshot(path=SNAPSHOT_DIR):
+    return os.path.exists(os.path.join(path, "dataset_dict.json"))
+
+
+def snapshot(path=SNAPSHOT_DIR, refresh=False):
+    # Download once (through the normal HF cache) and keep the Arrow files next to the scrapers
+    _require()
+    if has_snapshot(path) and not refresh:
+        return path
+    print(f"⬇️  Downloading {HF_DATASET}...")
+    datasets.load_dataset(HF_DATASET).save_to_disk(path)
+    print(f"   💾 Snapshot saved to {path}")
+    return path
+
+
+def load(split="train", path=SNAPSHOT_DIR, download=True):
+    # datasets.Dataset backed by memory-mapped Arrow files (nothing is read until it's used)
+    _require()
+    if not has_snapshot(path):
+        if not download:
+            raise FileNotFoundError(f"No snapshot at {path}; run `python filipino_dataset.py snapshot`")
+        snapshot(path)
+    return datasets.load_from_disk(path, keep_in_memory=False)[split]
+
+
+def label_map(features):
+    # int label -> "Fake" / "True", from the ClassLabel names when they say which is which
+    names = getattr(features.get("label"), "names", None) or []
+    named = {i: _NAMED_LABELS.get(name.strip().lower()) for i, name in enumerate(names)}
+    if names and all(named.values()):
+        return named
+    return LABELS
+
+
+def to_row(record, labels=LABELS):
+    label = labels[int(record["label"])]
+    return {
+        "text": record.get("article") or record.get("text") or "",
+        "label": label,
+        "category": label.lower(),
+        "title": record.get("title") or "",
+        "url": record.get("url") or "",
+        "source": SOURCE,
+    }
+
+
+def iter_rows(split="train", streaming=False, batch_size=1000, path=SNAPSHOT_DIR):
+    # Rows in the scraped datasets' schema, one Arrow batch in memory at a time
+    _require()
+    if streaming and not has_snapshot(path):
+        dataset = datasets.load_dataset(HF_DATASET, split=split, streaming=True)
+        labels = label_map(dataset.features or {})
+        for record in dataset:
+            yield to_row(record, labels)
+        return
+
+    dataset = load(split, path)
+    labels = label_map(dataset.features)
+    for batch in dataset.iter(batch_size=batch_size):
+        keys = list(batch)
+        for values in zip(*batch.values()):
+            yield to_row(dict(zip(keys, values)), labels)
+
+
+def _constant(value, n):
+    return pa.DictionaryArray.from_arrays(pa.array([0] * n, pa.int32()), pa.array([value]))
+
+
+def load_table(split="train", path=SNAPSHOT_DIR):
+    # pyarrow Table with COLUMNS; `text` is the snapshot's article column, still memory-mapped
+    if not HAS_PYARROW:
+        raise ImportError("load_table needs `pip install pyarrow`")
+    dataset = load(split, path)
+    table = dataset.with_format("arrow")[:]
+    labels = label_map(dataset.features)
+    names = pa.array([labels[i] for i in sorted(labels)])
+    n = table.num_rows
+    label_codes = pc.cast(table["label"], pa.int32()).combine_chunks()
+    columns = {
+        "text": table["article"],
+        "label": pa.DictionaryArray.from_arrays(label_codes, names),
+        "category": pa.DictionaryArray.from_arrays(label_codes, pc.utf8_lower(names)),
+        "title": table["title"] if "title" in table.column_names else pa.array([""] * n),
+        "url": table["url"] if "url" in table.column_names else pa.array([""] * n),
+        "source": _constant(SOURCE, n),
+    }
+    return pa.table([columns[c] for c in COLUMNS], names=COLUMNS)
+
+
+def export(dst, split="train", path=SNAPSHOT_DIR):
+    # To any DatasetWriter format, so it merges with the scraped files (merge_datasets.py)
+    with DatasetWriter(dst, batch_size=1000) as sink:
+        sink.write_many(iter_rows(split, path=path))
+    return sink.count
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if not args or args[0] not in ("snapshot", "export", "show"):
+        print("Usage: python filipino_dataset.py snapshot [--refresh] | export <output file> | show")
+        sys.exit(1)
+    if args[0] == "snapshot":
+        snapshot(refresh="--refresh" in args)
+    elif args[0] == "export":
+        if len(args) != 2:
+            sys.exit("Usage: python filipino_dataset.py export <output file>")
+        n = export(args[1])
+        print(f"🎉 Exported {n} rows to {args[1]}")
+    else:
+        print(next(iter_rows()))
@@ -0,0 +1,164 @@
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+
+from dedup import canonicalize_url
+from prequal import read_until_container
+
+# ==========================================
+# 🗄️ ON-DISK HTTP RESPONSE CACHE
+# ==========================================
+# Sits under get_soup so tweaking a selector in get_full_content doesn't mean
+# re-downloading thousands of pages. Entries are keyed by sha256(canonical URL)
+# and hold the raw body bytes (base64, gzipped) with the encoding requests used,
+# so a replay gives back exactly what the server sent, plus ETag /
+# Last-Modified for revalidation:
+#
+#   fresh (age < ttl)  -> served from disk, no request, no politeness wait
+#   stale              -> conditional GET, a 304 just refreshes the entry
+#   offline=True       -> replay only: cache hits or None, never the network
+#   revalidate=True    -> always a conditional GET, even when fresh (listing
+#                         pages change daily; a 304 still costs no body)
+#
+# evict() drops entries nobody has refreshed for KEEP_STALE ttls (the engine
+# runs it at start-up); until then a stale entry still buys a conditional GET.
+#
+# fetch(..., containers=...) streams the body and stops after the article
+# container (prequal.py); such entries are marked "truncated" and keep the
+# container list. A truncated entry only answers a fetch for the same
+# containers; anyone else (a full-page fetch, a changed selector) gets a miss.
+
+
+def entry_content(entry):
+    # Raw bytes of a cache entry (entries written before bytes were kept only have the decoded text)
+    if "content" in entry:
+        return base64.b64decode(entry["content"])
+    return entry["body"].encode("utf-8")
+
+
+KEEP_STALE = 4   # evict() default: entries untouched for this many ttls
+
+
+class CachedResponse:
+    # Just enough of requests.Response for the scrapers
+    def __init__(self, entry):
+        self.status_code = entry["status"]
+        self.url = entry["url"]
+        self.headers = entry.get("headers", {})
+        self.content = entry_content(entry)
+        self.encoding = entry.get("encoding")
+        self.text = self.content.decode(self.encoding or "utf-8", errors="replace")
+        self.from_cache = True
+
+
+class ResponseCache:
+    def __init__(self, cache_dir="http_cache", ttl=7 * 24 * 3600, offline=False):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def path_for(self, url):
+        key = hashlib.sha256(canonicalize_url(url).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], key + ".json.gz")
+
+    def load(self, url):
+        path = self.path_for(url)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, url, entry):
+        path = self.path_for(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"   # Fetch / prefetch threads may save one URL at once
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp, path)  # Atomic, so a crash never leaves half an entry
+
+    def usable(self, entry, containers):
+        # A cut-short body is only good for the container set it was cut for
+        if entry is None or not entry.get("truncated"):
+            return entry is not None
+        return entry.get("containers") == [list(c) for c in containers or ()]
+
+    def store(self, url, response, containers=None):
+        headers = {k: response.headers[k] for k in ("ETag", "Last-Modified", "Content-Type")
+                   if k in response.headers}
+        entry = {
+            "url": response.url,
+            "status": response.status_code,
+            "headers": headers,
+            "fetched_at": time.time(),
+            "content": base64.b64encode(response.content).decode("ascii"),
+            "encoding": getattr(response, "encoding", None),
+        }
+        if getattr(response, "truncated", False):
+            entry["truncated"] = True
+            entry["containers"] = [list(c) for c in containers]
+        self.save(url, entry)
+        return entry
+
+    def fetch(self, session, url, wait=None, containers=None, revalidate=False, **kwargs):
+        entry = self.load(url)
+        if not self.usable(entry, containers):
+            entry = None   # Refetched in full (or per the new containers), unconditionally
+        fresh = entry is not None and not revalidate and time.time() - entry["fetched_at"] < self.ttl
+        if entry and (self.offline or fresh):
+            self.hits += 1
+            return CachedResponse(entry)
+        if self.offline:
+            self.misses += 1
+            return None
+
+        # Stale or missing: go to the network (conditional if we can)
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry:
+            if "ETag" in entry["headers"]:
+                headers["If-None-Match"] = entry["headers"]["ETag"]
+            if "Last-Modified" in entry["headers"]:
+                headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+
+        if wait: wait(url)
+        if containers and isinstance(session, requests.Session):
+            response = read_until_container(session.get(url, headers=headers, stream=True, **kwargs), containers)
+        else:
+            response = session.get(url, headers=headers, **kwargs)
+        if response.status_code == 304 and entry:
+            self.revalidated += 1
+            entry["fetched_at"] = time.time()
+            self.save(url, entry)
+            return CachedResponse(entry)
+
+        self.misses += 1
+        if response.status_code == 200:
+            self.store(url, response, containers)
+        return response
+
+    def evict(self, max_age=None):
+        # Delete entries (and abandoned .tmp files) older than max_age (default: KEEP_STALE * ttl).
+        # Returns count removed.
+        max_age = self.ttl * KEEP_STALE if max_age is None else max_age
+        cutoff = time.time() - max_age
+        removed = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                        removed += 1
+                except FileNotFoundError:
+                    pass   # Another engine on the same cache got there first
+        return removed
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import Counter
+
+# ==========================================
+# 🔗 LISTING LINK CLASSIFIER
+# ==========================================
+# Every listing page repeats the same nav / footer / category / tag links, and
+# each one used to go through the site's string checks again on every page.
+# The spec's link rules (sites.py) are compiled once into a single ordered pass
+# (substring lists become one regex each), the first rule that rejects a link
+# names the reason, and rejected (class, href, title) triples are remembered in
+# a negative cache, optionally persisted as JSON so the next run starts warm.
+#
+#   title_too_short   len(title) < min_title_len
+#   off_site          href doesn't start with href_prefix
+#   not_article       href contains none of href_contains_any
+#   excluded_path     href contains one of href_excludes
+#   wrong_section     href lacks must_contain[class]
+#   junk_title        title contains one of junk_titles (case-insensitive)
+#   skip_title        skip_title_pattern in a title of <= skip_title_max_len chars
+#
+# The cache file is dropped when the rules change (it stores a fingerprint).
+
+RULE_KEYS = ("min_title_len", "href_prefix", "href_contains_any", "href_excludes",
+             "must_contain", "junk_titles", "skip_title_pattern", "skip_title_max_len")
+
+
+def _any_of(substrings):
+    return re.compile("|".join(map(re.escape, substrings))) if substrings else None
+
+
+def compile_rules(spec, category_type):
+    # -> [(rule name, predicate(href, title) -> True when the link is rejected)]
+    rules = []
+    min_len = spec.get("min_title_len", 0)
+    if min_len:
+        rules.append(("title_too_short", lambda href, title: len(title) < min_len))
+    prefix = spec.get("href_prefix")
+    if prefix:
+        rules.append(("off_site", lambda href, title: not href.startswith(prefix)))
+    contains_any = _any_of(spec.get("href_contains_any"))
+    if contains_any:
+        rules.append(("not_article", lambda href, title: not contains_any.search(href)))
+    excludes = _any_of(spec.get("href_excludes"))
+    if excludes:
+        rules.append(("excluded_path", lambda href, title: excludes.search(href) is not None))
+    must_contain = spec.get("must_contain", {}).get(category_type, "")
+    if must_contain:
+        rules.append(("wrong_section", lambda href, title: must_contain not in href))
+    junk_titles = _any_of([t.lower() for t in spec.get("junk_titles", [])])
+    if junk_titles:
+        rules.append(("junk_title", lambda href, title: junk_titles.search(title.lower()) is not None))
+    skip_pattern = spec.get("skip_title_pattern")
+    if skip_pattern:
+        max_len = spec["skip_title_max_len"]
+        rules.append(("skip_title", lambda href, title: len(title) <= max_len and skip_pattern in title.lower()))
+    return rules
+
+
+def rules_fingerprint(spec):
+    config = {k: spec[k] for k in RULE_KEYS if k in spec}
+    return hashlib.blake2b(json.dumps(config, sort_keys=True).encode("utf-8"), digest_size=8).hexdigest()
+
+
+class LinkClassifier:
+    def __init__(self, spec, cache_path=None, metrics=None):
+        self.spec = spec
+        self.source = spec.get("name", "")
+        self.cache_path = cache_path
+        self.metrics = metrics
+        self.fingerprint = rules_fingerprint(spec)
+        self.rules = {}               # class -> compiled rules
+        self.rejected = {}            # "class\thref\ttitle" -> rule name
+        self.counts = Counter()       # rule name -> links rejected (cached or not)
+        self.cache_hits = 0
+        self.accepted = 0
+        self.lock = threading.Lock()   # Cache + counters; both classes of a site may run at once (scheduler.py)
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path, encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved.get("rules") == self.fingerprint:
+                self.rejected = saved.get("rejected", {})
+                print(f"   🔗 Link cache {cache_path}: {len(self.rejected)} known rejects")
+            else:
+                print(f"   🔗 Link rules changed, ignoring {cache_path}")
+
+    def classify(self, href, title, category_type):
+        # -> None if the link is a candidate article, else the name of the rule that rejects it
+        key = f"{category_type}\t{href}\t{title}"
+        with self.lock:
+            reason = self.rejected.get(key)
+            if reason is not None:
+                self.cache_hits += 1
+            else:
+                rules = self.rules.get(category_type)
+                if rules is None:
+                    rules = self.rules[category_type] = compile_rules(self.spec, category_type)
+                reason = next((name for name, rejects in rules if rejects(href, title)), None)
+                if reason is None:
+                    self.accepted += 1
+                    return None
+                self.rejected[key] = reason
+            self.counts[reason] += 1
+        if self.metrics is not None:
+            self.metrics.inc("links_rejected_total", source=self.source, rule=reason)
+        return reason
+
+    def filter(self, links, category_type):
+        # [(href, title)] -> the ones that pass, in order
+        return [(href, title) for href, title in links if self.classify(href, title, category_type) is None]
+
+    def report(self):
+        with self.lock:
+            rejected = sum(self.counts.values())
+            by_rule = ", ".join(f"{name} {n}" for name, n in self.counts.most_common())
+        return (f"{self.accepted} kept, {rejected} rejected ({by_rule or 'none'}), "
+                f"{self.cache_hits} from cache")
+
+    def save(self):
+        if not self.cache_path:
+            return
+        tmp = self.cache_path + ".tmp"
+        with self.lock:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"rules": self.fingerprint, "rejected": dict(self.rejected)}, f, ensure_ascii=False)
+            os.replace(tmp, self.cache_path)
@@ -0,0 +1,224 @@
+import hashlib
+import os
+import sys
+from collections import Counter
+from itertools import chain
+
+import numpy as np
+
+from dataset_writer import DatasetWriter, read_rows
+
+# ==========================================
+# 🧬 MULTI-SOURCE MERGE + NEAR-DUPLICATE REMOVAL
+# ==========================================
+# Each scraper writes its own file and syndicated / reposted stories show up
+# in several of them (sometimes once as Fake and once as True). This merges
+# them into one dataset and drops:
+#
+#   - exact duplicates (same text after lower-casing / whitespace folding)
+#   - near duplicates (estimated Jaccard >= threshold on word 5-gram shingles)
+#
+# Near duplicates are found with MinHash + LSH banding, all in numpy: every
+# doc gets a 128-value signature (one-permutation MinHash over the hashes of
+# its shingles, computed for a whole batch of docs at once), signatures are
+# cut into bands, and only docs that share a band bucket are compared.
+# Roughly linear in the number of articles, not pairwise.
+#
+# The first copy (in input-file order) is kept. A cluster holding both Fake
+# and True copies is label noise and is dropped entirely unless
+# conflicts="first".
+#
+#   python merge_datasets.py Merged_Dataset.csv                  # the 4 default outputs
+#   python merge_datasets.py Merged.parquet a.csv b.jsonl --threshold 0.9
+
+DEFAULT_INPUTS = [
+    "Rappler_Full_Dataset.csv",
+    "VeraFiles_Full_Dataset.csv",
+    "MindaNews_Full_Dataset.csv",
+    "PressOne_Harvester_Dataset.csv",
+]
+
+SHINGLE_SIZE = 5
+NUM_PERM = 128      # Signature length (one-permutation hashing: 128 bins, one hash per shingle)
+BANDS = 16          # 16 bands x 8 rows: pairs above ~0.7 Jaccard almost always share a bucket
+_EMPTY = np.iinfo(np.uint32).max
+_ROLL = np.uint64(0x100000001B3)
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def normalize(text):
+    return " ".join((text or "").lower().split())
+
+
+def exact_key(text):
+    return hashlib.blake2b(normalize(text).encode("utf-8"), digest_size=16).digest()
+
+
+def shingle_hashes(texts):
+    # -> (hash of every word 5-gram, index of the doc it came from) for a whole batch.
+    # Words are hashed once with the builtin hash() (fine: signatures are only compared
+    # within one run), then each 5-gram is a rolling combination of 5 word hashes.
+    words = [(t or "").lower().split() for t in texts]
+    lengths = np.fromiter(map(len, words), np.int64, len(words))
+    h = np.fromiter(map(hash, chain.from_iterable(words)), np.int64, int(lengths.sum())).view(np.uint64)
+    grams = h.copy()
+    with np.errstate(over="ignore"):
+        for j in range(1, SHINGLE_SIZE):
+            grams[:len(h) - j] = grams[:len(h) - j] * _ROLL + h[j:]
+
+    doc = np.repeat(np.arange(len(texts)), lengths)
+    offset = np.arange(len(h)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    valid = offset + SHINGLE_SIZE <= lengths[doc]
+    values, doc = grams[valid], doc[valid]
+
+    # Docs shorter than one shingle: the whole (possibly empty) word tuple is the only shingle
+    short = np.flatnonzero(lengths < SHINGLE_SIZE)
+    if len(short):
+        extra = np.fromiter((hash(tuple(words[i])) for i in short), np.int64, len(short)).view(np.uint64)
+        values = np.concatenate([values, extra])
+        doc = np.concatenate([doc, short])
+    return values, doc
+
+
+def minhash(texts):
+    # (len(texts), NUM_PERM) uint32 signatures. Each shingle is hashed once; its low bits
+    # pick a bin and the rest is min-reduced into that bin (one-permutation MinHash).
+    values, doc = shingle_hashes(texts)
+    with np.errstate(over="ignore"):
+        mixed = (values * _MIX) >> np.uint64(32)
+    bins = (mixed % np.uint64(NUM_PERM)).astype(np.int64)
+    signature = np.full(len(texts) * NUM_PERM, _EMPTY, dtype=np.uint32)
+    np.minimum.at(signature, doc * NUM_PERM + bins, (mixed // np.uint64(NUM_PERM)).astype(np.uint32))
+    signature = signature.reshape(len(texts), NUM_PERM)
+
+    # Densify: an empty bin borrows the next non-empty bin to its right (short docs)
+    empty = signature == _EMPTY
+    for shift in range(1, NUM_PERM):
+        if not empty.any():
+            break
+        borrowed = np.roll(signature, -shift, axis=1)
+        fill = empty & (borrowed != _EMPTY)
+        signature[fill] = borrowed[fill]
+        empty &= ~fill
+    return signature
+
+
+class UnionFind:
+    def __init__(self, n):
+        self.parent = np.arange(n)
+
+    def find(self, i):
+        root = i
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[i] != root:
+            self.parent[i], i = root, self.parent[i]
+        return root
+
+    def union(self, i, j):
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            # Lower index wins, so the first copy in input order is the cluster root
+            self.parent[max(ri, rj)] = min(ri, rj)
+
+
+def near_duplicate_clusters(signatures, threshold=0.8, bands=BANDS):
+    n = len(signatures)
+    uf = UnionFind(n)
+    rows = signatures.shape[1] // bands
+    for b in range(bands):
+        band = np.ascontiguousarray(signatures[:, b * rows:(b + 1) * rows])
+        _, bucket = np.unique(band.view(np.dtype((np.void, band.dtype.itemsize * rows))).ravel(),
+                              return_inverse=True)
+        order = np.argsort(bucket, kind="stable")
+        sorted_buckets = bucket[order]
+        # Compare every doc with the first doc of its bucket (verified on the full signature)
+        first = np.searchsorted(sorted_buckets, sorted_buckets)
+        heads = order[first]
+        mask = heads != order
+        if not mask.any():
+            continue
+        docs, leaders = order[mask], heads[mask]
+        similarity = (signatures[docs] == signatures[leaders]).mean(axis=1)
+        for i, j in zip(docs[similarity >= threshold], leaders[similarity >= threshold]):
+            uf.union(int(i), int(j))
+    return np.array([uf.find(i) for i in range(n)])
+
+
+def merge_datasets(inputs, output, threshold=0.8, conflicts="drop", batch_size=2000):
+    inputs = [p for p in inputs if os.path.exists(p)]
+    if not inputs:
+        raise FileNotFoundError("None of the input datasets exist")
+
+    # Pass 1: exact keys, labels and MinHash signatures only (texts are not kept)
+    keys, labels, signatures, texts = [], [], [], []
+    for path in inputs:
+        for row in read_rows(path):
+            keys.append(exact_key(row["text"]))
+            labels.append(row["label"])
+            texts.append(row["text"])
+            if len(texts) >= batch_size:
+                signatures.append(minhash(texts))
+                texts = []
+    if texts:
+        signatures.append(minhash(texts))
+    n = len(keys)
+    signatures = np.concatenate(signatures) if signatures else np.zeros((0, NUM_PERM), np.uint32)
+
+    # Exact duplicates first: every copy points at the first occurrence
+    first_seen = {}
+    root = np.array([first_seen.setdefault(k, i) for i, k in enumerate(keys)])
+    # ... then near duplicates among the remaining representatives
+    reps = np.flatnonzero(root == np.arange(n))
+    if len(reps) > 1:
+        root = reps[near_duplicate_clusters(signatures[reps], threshold)][np.searchsorted(reps, root)]
+
+    cluster_labels = {}
+    for i in range(n):
+        cluster_labels.setdefault(root[i], set()).add(labels[i])
+    conflicting = {r for r, ls in cluster_labels.items() if len(ls) > 1}
+    keep = root == np.arange(n)
+    if conflicts == "drop":
+        keep &= ~np.isin(root, list(conflicting))
+
+    # Pass 2: stream the kept rows out in input order
+    stats = {
+        "total": n,
+        "exact": n - len(reps),
+        "near": len(reps) - int((root == np.arange(n)).sum()),
+        "conflict_clusters": len(conflicting),
+        "kept": int(keep.sum()),
+        "kept_by_source": Counter(),
+    }
+    i = 0
+    with DatasetWriter(output) as sink:
+        for path in inputs:
+            for row in read_rows(path):
+                if keep[i]:
+                    sink.write(row)
+                    stats["kept_by_source"][row["source"]] += 1
+                i += 1
+    return stats
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    threshold = 0.8
+    if "--threshold" in args:
+        at = args.index("--threshold")
+        threshold = float(args[at + 1])
+        del args[at:at + 2]
+    conflicts = "first" if "--keep-conflicts" in args else "drop"
+    args = [a for a in args if a != "--keep-conflicts"]
+    if not args:
+        print("Usage: python merge_datasets.py <output> [inputs...] [--threshold 0.8] [--keep-conflicts]")
+        sys.exit(1)
+
+    stats = merge_datasets(args[1:] or DEFAULT_INPUTS, args[0], threshold=threshold, conflicts=conflicts)
+    print(f"🧬 Merged {stats['total']} rows -> {stats['kept']} kept in {args[0]}")
+    print(f"   Exact duplicates: {stats['exact']}")
+    print(f"   Near duplicates:  {stats['near']}")
+    print(f"   Fake/True conflict clusters ({'dropped' if conflicts == 'drop' else 'kept first'}): "
+          f"{stats['conflict_clusters']}")
+    for source, count in stats["kept_by_source"].most_common():
+        print(f"   {source}: {count}")
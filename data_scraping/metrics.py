@@ -0,0 +1,206 @@
+import bisect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ==========================================
+# 📈 CRAWL METRICS
+# ==========================================
+# Counters, gauges and latency histograms for the hot path, so a slow run can
+# be pinned on the network, the parsers or the throttle instead of guessed
+# from the emoji prints. Everything is labelled (host, status, ...):
+#
+#   fetch_seconds{host,status,cache}     one attempt in get_response
+#   throttle_wait_seconds{host}          time spent in the politeness limiter
+#   retries_total{host} / bytes_total{host} / responses_total{host,status,cache}
+#   listing_parse_seconds{source}        BeautifulSoup on a listing page
+#   parse_seconds{source}                extraction in a parse worker
+#   handoff_queue_depth / parse_in_flight (gauges, see pipeline.py)
+#   rows_total{source,category,outcome}  accepted / short / failed
+#   throttle_rate{host}                  current requests/second
+#   truncated_total{host}                article bodies cut short after the container (prequal.py)
+#   short_pages_skipped_total{source}    known-short articles not fetched again
+#   links_rejected_total{source,rule}    listing links dropped by linkfilter.py
+#
+# Exports: a JSON-lines file (one snapshot every `interval` seconds and at the
+# end of a run) and, optionally, a Prometheus text endpoint:
+#
+#   metrics = Metrics("rappler_metrics.jsonl", prometheus_port=9108)
+#   curl localhost:9108/metrics
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def _key(labels):
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _prom_labels(key, extra=()):
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+
+class Histogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)   # Last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        # Upper bound of the bucket holding the q-th observation (good enough for p50/p99)
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets + (float("inf"),), self.counts):
+            seen += n
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def to_dict(self):
+        return {"count": self.count, "sum": round(self.sum, 6),
+                "p50": self.quantile(0.5), "p99": self.quantile(0.99),
+                "buckets": dict(zip([str(b) for b in self.buckets] + ["+Inf"], self.counts))}
+
+
+class Metrics:
+    def __init__(self, jsonl_path=None, interval=10.0, prometheus_port=None):
+        self.jsonl_path = jsonl_path
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.counters = {}     # name -> {label key: value}
+        self.gauges = {}
+        self.histograms = {}
+        self.stopped = threading.Event()
+        self.server = None
+        if jsonl_path:
+            threading.Thread(target=self._flush_loop, daemon=True).start()
+        if prometheus_port is not None:
+            self.serve(prometheus_port)
+
+    # ---------- Recording ----------
+    def inc(self, name, value=1, **labels):
+        with self.lock:
+            series = self.counters.setdefault(name, {})
+            key = _key(labels)
+            series[key] = series.get(key, 0) + value
+
+    def set(self, name, value, **labels):
+        with self.lock:
+            self.gauges.setdefault(name, {})[_key(labels)] = value
+
+    def add(self, name, delta, **labels):
+        # Up/down gauge (in-flight work)
+        with self.lock:
+            series = self.gauges.setdefault(name, {})
+            key = _key(labels)
+            series[key] = series.get(key, 0) + delta
+
+    def observe(self, name, value, **labels):
+        with self.lock:
+            series = self.histograms.setdefault(name, {})
+            key = _key(labels)
+            if key not in series:
+                series[key] = Histogram()
+            series[key].observe(value)
+
+    @contextmanager
+    def time(self, name, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    # ---------- Export ----------
+    def snapshot(self):
+        with self.lock:
+            return {
+                "ts": round(time.time(), 3),
+                "counters": {n: [{"labels": dict(k), "value": v} for k, v in s.items()]
+                             for n, s in self.counters.items()},
+                "gauges": {n: [{"labels": dict(k), "value": v} for k, v in s.items()]
+                           for n, s in self.gauges.items()},
+                "histograms": {n: [dict(labels=dict(k), **h.to_dict()) for k, h in s.items()]
+                               for n, s in self.histograms.items()},
+            }
+
+    def flush(self):
+        if not self.jsonl_path:
+            return
+        line = json.dumps(self.snapshot(), ensure_ascii=False)
+        with open(self.jsonl_path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+    def _flush_loop(self):
+        while not self.stopped.wait(self.interval):
+            self.flush()
+
+    def prometheus_text(self):
+        lines = []
+        with self.lock:
+            for name, series in self.counters.items():
+                lines.append(f"# TYPE {name} counter")
+                lines += [f"{name}{_prom_labels(k)} {v}" for k, v in series.items()]
+            for name, series in self.gauges.items():
+                lines.append(f"# TYPE {name} gauge")
+                lines += [f"{name}{_prom_labels(k)} {v}" for k, v in series.items()]
+            for name, series in self.histograms.items():
+                lines.append(f"# TYPE {name} histogram")
+                for k, h in series.items():
+                    cumulative = 0
+                    for bound, n in zip([str(b) for b in h.buckets] + ["+Inf"], h.counts):
+                        cumulative += n
+                        lines.append(f"{name}_bucket{_prom_labels(k, [('le', bound)])} {cumulative}")
+                    lines.append(f"{name}_sum{_prom_labels(k)} {h.sum}")
+                    lines.append(f"{name}_count{_prom_labels(k)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port):
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                body = metrics.prometheus_text().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        print(f"   📈 Prometheus metrics on http://127.0.0.1:{self.server.server_address[1]}/metrics")
+
+    def total(self, name):
+        with self.lock:
+            if name in self.histograms:
+                return sum(h.sum for h in self.histograms[name].values())
+            return sum(self.counters.get(name, {}).values())
+
+    def summary(self):
+        # Where the time went; fetch and throttle overlap across threads, so compare, don't add
+        return (f"fetch {self.total('fetch_seconds'):.1f}s, throttle wait {self.total('throttle_wait_seconds'):.1f}s, "
+                f"parse {self.total('parse_seconds'):.1f}s, listing parse {self.total('listing_parse_seconds'):.1f}s, "
+                f"{self.total('retries_total')} retries, {self.total('bytes_total') / 1e6:.1f} MB")
+
+    def close(self):
+        self.stopped.set()
+        self.flush()
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
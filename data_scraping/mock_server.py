@@ -0,0 +1,290 @@
+import contextlib
+import hashlib
+import io
+import json
+import os
+import random
+import re
+import secrets
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+# ==========================================
+# 🧪 LOCAL STAND-IN NEWS SITE
+# ==========================================
+# A tiny fake outlet for offline experiments. With challenge=True it behaves
+# like Deflect: requests without a valid clearance cookie get a 403 page
+# whose <script> sets the cookie and reloads (a real browser passes it, a
+# plain GET doesn't). The cookie is tied to the User-Agent that solved it and
+# expires after token_ttl seconds. It also serves an RSS feed (/section/feed/)
+# and a sitemap index (/sitemap.xml) for delta crawls; touch(i) "edits" article i.
+# Pages carry an ETag and answer If-None-Match with 304, like a real CMS.
+#
+# For benchmarks (see benchmark.py) it can also misbehave on purpose: add
+# `latency` (+ random `jitter`) seconds to every response, answer a fraction
+# of requests with 403 (`block_rate`, body = e.g. the recorded Deflect page in
+# debug_source.html) or 503 (`error_rate`), and serve recorded article pages
+# (`fixtures`) instead of the lorem-ipsum stand-in.
+#
+#   python mock_server.py [--challenge] [--port 8000]
+#   python mock_server.py --check-delta   # delta mode must refetch an edited article
+
+CLEARANCE_COOKIE = "mock_clearance"
+
+CHALLENGE_PAGE = """<html><head><title>Error 403 | Deflect</title>
+<script>document.cookie = "{cookie}={token}; path=/"; location.reload();</script>
+</head><body><p>Checking your browser...</p></body></html>"""
+
+ARTICLE_PAGE = """<html><head><title>Article {id}</title></head><body>
+<article><div class="uk-article-content entry-content post-content">
+<p>Stand-in article number {id}. {filler}</p>
+<p>Second paragraph of article {id}, long enough to pass every length filter we use.</p>
+</div></article></body></html>"""
+
+LISTING_ITEM = '<h3 class="uk-card-title"><a href="{href}">{title}</a></h3>'
+
+LISTING_PAGE = """<html><head><title>Section page {page}</title></head><body>
+{items}
+</body></html>"""
+
+RSS_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Stand-in section</title>
+{items}
+</channel></rss>"""
+
+SITEMAP_INDEX = """<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+{items}
+</sitemapindex>"""
+
+SITEMAP_URLSET = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+{items}
+</urlset>"""
+
+
+class MockNewsServer:
+    def __init__(self, port=0, challenge=False, token_ttl=None, articles_per_page=10, pages=5,
+                 latency=0.0, jitter=0.0, block_rate=0.0, error_rate=0.0, block_page=None,
+                 fixtures=None, listing_item=LISTING_ITEM, sections=("section",), seed=0):
+        self.port = port
+        self.challenge = challenge
+        self.token_ttl = token_ttl
+        self.articles_per_page = articles_per_page
+        self.pages = pages
+        self.tokens = {}   # token -> (user_agent, issued_at)
+        self.started = time.time()
+        self.modified = {}   # article id -> last modified (see touch())
+        self.latency = latency
+        self.jitter = jitter
+        self.block_rate = block_rate
+        self.error_rate = error_rate
+        self.block_page = block_page or "<html><head><title>Error 403</title></head><body><p>Forbidden</p></body></html>"
+        self.fixtures = list(fixtures or [])   # Article bodies (str / bytes), served round-robin
+        self.listing_item = listing_item
+        self.sections = list(sections)   # Each gets its own articles: /<name>/, /<name>/page/N/
+        self.rng = random.Random(seed)
+        self.served = Counter()   # status code -> responses sent
+        self.lock = threading.Lock()
+        self.httpd = None
+        self.host = None
+        self.thread = None
+
+    # ---------- Challenge ----------
+    def issue_token(self, user_agent):
+        token = secrets.token_hex(8)
+        with self.lock:
+            self.tokens[token] = (user_agent, time.time())
+        return token
+
+    def has_clearance(self, headers):
+        match = re.search(rf"{CLEARANCE_COOKIE}=(\w+)", headers.get("Cookie", ""))
+        if not match:
+            return False
+        with self.lock:
+            entry = self.tokens.get(match.group(1))
+        if not entry:
+            return False
+        user_agent, issued_at = entry
+        if self.token_ttl is not None and time.time() - issued_at > self.token_ttl:
+            return False
+        return user_agent == headers.get("User-Agent", "")
+
+    # ---------- Content ----------
+    def touch(self, article_id):
+        # Pretend an article was edited: its text and its feed / sitemap lastmod change
+        self.modified[article_id] = time.time()
+
+    def lastmod(self, article_id):
+        return time.strftime("%Y-%m-%dT%H:%M:%S+00:00",
+                             time.gmtime(self.modified.get(article_id, self.started)))
+
+    def render(self, path):
+        m = re.match(r"^/articles/(\d+)/?$", path)
+        if m and self.fixtures:
+            return self.fixtures[int(m.group(1)) % len(self.fixtures)]
+        if m:
+            filler = "Lorem ipsum dolor sit amet. " * 8
+            if int(m.group(1)) in self.modified:
+                filler = "Updated. " + filler
+            return ARTICLE_PAGE.format(id=m.group(1), filler=filler)
+        total = self.pages * self.articles_per_page * len(self.sections)
+        if re.match(r"^/section/feed/?$", path):
+            # Newest first, one listing page worth, like a WordPress feed
+            items = "\n".join(
+                f"<item><title>Stand-in headline for article number {i}</title>"
+                f"<link>http://{self.host}/articles/{i}</link>"
+                f"<pubDate>{time.strftime('%a, %d %b %Y %H:%M:%S +0000', time.gmtime(self.modified.get(i, self.started)))}</pubDate></item>"
+                for i in range(self.articles_per_page)
+            )
+            return RSS_FEED.format(items=items)
+        if path == "/sitemap.xml":
+            items = "\n".join(
+                f"<sitemap><loc>http://{self.host}/sitemap-{page}.xml</loc><lastmod>{max(self.lastmod(i) for i in range((page - 1) * self.articles_per_page, page * self.articles_per_page))}</lastmod></sitemap>"
+                for page in range(1, self.pages + 1)
+            )
+            return SITEMAP_INDEX.format(items=items)
+        m = re.match(r"^/sitemap-(\d+)\.xml$", path)
+        if m and 1 <= int(m.group(1)) <= self.pages:
+            first = (int(m.group(1)) - 1) * self.articles_per_page
+            items = "\n".join(
+                f"<url><loc>http://{self.host}/articles/{i}</loc><lastmod>{self.lastmod(i)}</lastmod></url>"
+                for i in range(first, min(first + self.articles_per_page, total))
+            )
+            return SITEMAP_URLSET.format(items=items)
+        m = re.match(r"^/([\w-]+)/?(?:page/(\d+)/?)?(?:\?page=(\d+))?$", path)
+        if m and m.group(1) in self.sections:
+            page = int(m.group(2) or m.group(3) or 1)
+            if page > self.pages:
+                return None
+            offset = self.sections.index(m.group(1)) * self.pages * self.articles_per_page
+            first = offset + (page - 1) * self.articles_per_page
+            items = "\n".join(
+                self.listing_item.format(href=f"/articles/{i}", title=f"Stand-in headline for article number {i}")
+                for i in range(first, first + self.articles_per_page)
+            )
+            return LISTING_PAGE.format(page=page, items=items)
+        return None
+
+    def fault(self):
+        # -> 403 / 503 / None for this request, according to block_rate / error_rate
+        with self.lock:
+            roll = self.rng.random()
+        if roll < self.block_rate:
+            return 403
+        if roll < self.block_rate + self.error_rate:
+            return 503
+        return None
+
+    def make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def send_html(self, status, body, etag=None):
+                data = body.encode("utf-8") if isinstance(body, str) else body
+                with server.lock:
+                    server.served[status] += 1
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                if etag:
+                    self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if server.latency or server.jitter:
+                    time.sleep(server.latency + server.rng.uniform(0, server.jitter))
+                fault = server.fault()
+                if fault == 403:
+                    return self.send_html(403, server.block_page)
+                if fault == 503:
+                    return self.send_html(503, "<html><body><p>Service Unavailable</p></body></html>")
+                if server.challenge and not server.has_clearance(self.headers):
+                    token = server.issue_token(self.headers.get("User-Agent", ""))
+                    return self.send_html(403, CHALLENGE_PAGE.format(cookie=CLEARANCE_COOKIE, token=token))
+                body = server.render(self.path)
+                if body is None:
+                    return self.send_html(404, "<html><body><p>Not found</p></body></html>")
+                data = body.encode("utf-8") if isinstance(body, str) else body
+                etag = f'"{hashlib.blake2b(data, digest_size=8).hexdigest()}"'
+                if self.headers.get("If-None-Match") == etag:
+                    return self.send_html(304, b"", etag)
+                self.send_html(200, data, etag)
+
+        return Handler
+
+    def start(self):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", self.port), self.make_handler())
+        self.port = self.httpd.server_address[1]
+        self.host = f"127.0.0.1:{self.port}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return f"http://127.0.0.1:{self.port}"
+
+    def stop(self):
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+
+
+def solve_mock_challenge(url, user_agent="Mozilla/5.0 (stand-in browser)"):
+    # Does what Chrome would do with CHALLENGE_PAGE: run the cookie script.
+    # Same (cookies, user_agent) shape as session_bootstrap.SeleniumSolver.
+    r = requests.get(url, headers={"User-Agent": user_agent}, timeout=10)
+    match = re.search(rf'{CLEARANCE_COOKIE}=(\w+)', r.text)
+    cookies = [{"name": CLEARANCE_COOKIE, "value": match.group(1), "path": "/"}] if match else []
+    return cookies, user_agent
+
+
+def check_delta_refresh():
+    # Crawl, edit an article, run delta mode: the row must carry the edited text, not the cached copy
+    from engine import CrawlEngine
+    from sites import RAPPLER
+
+    server = MockNewsServer()
+    base = server.start()
+    spec = dict(RAPPLER, sections={"fake": [base + "/section/"], "true": []},
+                feeds={"fake": [base + "/section/feed/"], "true": []},
+                href_prefix=base, requests_per_second=50, max_requests_per_second=100)
+    with tempfile.TemporaryDirectory() as tmp:
+        rows_file, state_file = os.path.join(tmp, "delta.jsonl"), os.path.join(tmp, "state.json")
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine = CrawlEngine(spec, cache_dir=os.path.join(tmp, "cache"),
+                                 checkpoint_file=os.path.join(tmp, "checkpoint.jsonl"))
+            engine.scrape_section("fake", 5)               # Articles 0-4 now in the (fresh) cache
+            engine.run_delta(rows_file, state_file)        # Baseline lastmods, nothing new
+            time.sleep(1.1)                                # Feed dates have 1 s resolution
+            server.touch(3)
+            engine.run_delta(rows_file, state_file)
+        with open(rows_file, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f]
+    server.stop()
+
+    edited = [row for row in rows if row["url"].rstrip("/").endswith("/articles/3")]
+    ok = len(rows) == 1 and len(edited) == 1 and "Updated." in edited[0]["text"]
+    print(f"{'✅' if ok else '❌'} Delta refresh: {len(rows)} row(s), edited text "
+          f"{'picked up' if ok else 'missing'} | statuses {dict(server.served)}")
+    return ok
+
+
+if __name__ == "__main__":
+    if "--check-delta" in sys.argv:
+        sys.exit(0 if check_delta_refresh() else 1)
+    port = int(sys.argv[sys.argv.index("--port") + 1]) if "--port" in sys.argv else 8000
+    server = MockNewsServer(port=port, challenge="--challenge" in sys.argv)
+    print(f"🧪 Stand-in news site on {server.start()}/section/ (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,350 @@
+import csv
+import functools
+import glob
+import gzip
+import html as html_lib
+import json
+import os
+import re
+import sys
+
+from bs4 import BeautifulSoup, CData, NavigableString, Tag, UnicodeDammit
+
+from http_cache import entry_content
+
+try:
+    import lxml.html
+    from lxml import etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# ==========================================
+# ⚡ PARSER BACKENDS
+# ==========================================
+# get_full_content only needs the <p> text of one container div, but used to
+# build a full html.parser soup for every article. Backends:
+#
+#   "lxml" -> libxml2 tree + XPath, ~5x faster and much lighter (default if installed)
+#   "bs4"  -> the original BeautifulSoup/html.parser path, kept as the fallback
+#
+# Run `python parsers.py [files...]` to check both backends give identical
+# text on debug_source.html, every page in the response cache and sample
+# article pages built from the existing *_Full_Dataset.csv rows.
+
+DEFAULT_BACKEND = "lxml" if HAS_LXML else "bs4"
+
+# (tag, class) fallback chains, tried in order. class=None means "any".
+ARTICLE_CONTAINERS = {
+    "Rappler": [("div", "post-content"), ("div", "entry-content"), ("article", None)],
+    "Vera Files": [("div", "uk-article-content"), ("div", "entry-content"), ("article", None)],
+    "MindaNews": [("div", "entry-content")],
+    "PressOne.PH": [("div", "entry-content"), ("div", "post-content"), ("article", None)],
+}
+
+
+# ==========================================
+# 🧹 BOILERPLATE SUBTREES
+# ==========================================
+# Share bars, Jetpack "sharedaddy" widgets, related-post blocks etc. sit inside
+# the article container, so their <p> text used to end up in the dataset (the
+# old find_all(['script', 'style', 'div.share-bar']) took 'div.share-bar' for
+# a tag name and never matched). Both backends now collect paragraphs in one
+# walk over the container that skips a subtree when
+#
+#   - it matches one of the spec's junk_tags, as simple CSS selectors:
+#     "script", "div.share-bar", ".sharedaddy", "div#comments", "ul.a.b"
+#   - or its visible text is mostly link text (related posts, tag clouds,
+#     "more from" lists): link density above LINK_DENSITY, for list / nav-like
+#     blocks (ul, nav, aside, ...) and for div / section only when no <p>
+#     was kept inside them, so a wrapper is never dropped with its paragraphs
+#
+# Dropped text is never counted towards the enclosing block's density.
+
+DEFAULT_JUNK = ("script", "style", "noscript", "template", "iframe", "form")
+DENSITY_TAGS = frozenset(("aside", "nav", "ul", "ol", "table", "footer", "header"))
+LEAF_DENSITY_TAGS = frozenset(("div", "section"))
+LINK_DENSITY = 0.5
+
+_SELECTOR = re.compile(r'^([a-zA-Z][\w-]*|\*)?((?:[.#][\w-]+)*)$')
+
+
+def parse_selector(selector):
+    # "div.share-bar#x" -> ("div", frozenset({"share-bar"}), "x"); tag None = any
+    match = _SELECTOR.match(selector.strip())
+    if not match or not selector.strip():
+        raise ValueError(f"Unsupported junk selector: {selector!r}")
+    tag, rest = match.groups()
+    parts = re.findall(r'([.#])([\w-]+)', rest)
+    ids = [name for kind, name in parts if kind == "#"]
+    return (None if tag in (None, "*") else tag.lower(),
+            frozenset(name for kind, name in parts if kind == "."),
+            ids[0] if ids else None)
+
+
+class JunkFilter:
+    def __init__(self, selectors=DEFAULT_JUNK, link_density=LINK_DENSITY, density_tags=DENSITY_TAGS,
+                 leaf_density_tags=LEAF_DENSITY_TAGS):
+        self.by_tag = {}     # tag -> [(classes, id)]; None -> rules for any tag
+        for selector in selectors:
+            tag, classes, id_ = parse_selector(selector)
+            self.by_tag.setdefault(tag, []).append((classes, id_))
+        self.any_tag = self.by_tag.pop(None, [])
+        self.link_density = link_density
+        self.density_tags = density_tags
+        self.leaf_density_tags = leaf_density_tags
+
+    def matches(self, tag, class_attr, id_attr):
+        rules = self.by_tag.get(tag)
+        if rules is None and not self.any_tag:
+            return False
+        classes = set(class_attr.split()) if isinstance(class_attr, str) else set(class_attr or ())
+        return any(cls <= classes and (id_ is None or id_ == id_attr)
+                   for cls, id_ in (rules or []) + self.any_tag)
+
+    def too_linky(self, tag, text_len, link_len, has_paragraphs):
+        if tag not in self.density_tags and (has_paragraphs or tag not in self.leaf_density_tags):
+            return False
+        return text_len > 0 and link_len > self.link_density * text_len
+
+
+@functools.lru_cache(maxsize=None)
+def _junk_filter(junk_tags):
+    return JunkFilter(junk_tags)
+
+
+def junk_filter(junk_tags=DEFAULT_JUNK):
+    # One compiled filter per site (and per parse process)
+    return _junk_filter(tuple(junk_tags))
+
+
+def _visible_len(text):
+    return len(text.strip()) if text else 0
+
+
+class _Paragraph(list):
+    # Text buffer of the <p> being collected. A <p> start tag ends the open one, as in lxml
+    # and browsers (html.parser nests them instead): it's closed and takes no more text.
+    closed = False
+
+
+_XML_DECLARATION = re.compile(r'^\ufeff?\s*<\?xml[^>]*\?>')
+
+
+def _open_paragraph(paragraphs, outer):
+    if outer is not None:
+        outer.closed = True
+    paragraphs.append("")
+    return _Paragraph()
+
+
+def _lxml_walk(node, junk, paragraphs, sink):
+    # -> (visible chars, link chars) kept under node. Each <p> collects its text in its own
+    # buffer; sink is the open <p>'s buffer or None.
+    outer = sink
+    if node.tag == "p":
+        slot = len(paragraphs)
+        sink = _open_paragraph(paragraphs, outer)
+    text_len = _visible_len(node.text)
+    if node.text and sink is not None and not sink.closed:
+        sink.append(node.text)
+    link_len = 0
+    for child in node:
+        tag = child.tag
+        if isinstance(tag, str) and not junk.matches(tag, child.get("class"), child.get("id")):
+            kept_paragraphs, kept_text = len(paragraphs), len(sink) if sink is not None else 0
+            child_text, child_links = _lxml_walk(child, junk, paragraphs, sink)
+            if junk.too_linky(tag, child_text, child_links, len(paragraphs) > kept_paragraphs):
+                del paragraphs[kept_paragraphs:]
+                if sink is not None:
+                    del sink[kept_text:]
+            else:
+                text_len += child_text
+                link_len += child_links
+        # Comments, processing instructions and dropped subtrees still keep their tail
+        if child.tail:
+            text_len += _visible_len(child.tail)
+            if sink is not None and not sink.closed:
+                sink.append(child.tail)
+    if node.tag == "a":
+        link_len = text_len
+    if sink is not outer:
+        paragraphs[slot] = "".join(sink)
+    return text_len, link_len
+
+
+def _bs4_walk(node, junk, paragraphs, sink):
+    outer = sink
+    if node.name == "p":
+        slot = len(paragraphs)
+        sink = _open_paragraph(paragraphs, outer)
+    text_len = link_len = 0
+    for child in node.children:
+        if isinstance(child, Tag):
+            if junk.matches(child.name, child.get("class"), child.get("id")):
+                continue
+            kept_paragraphs, kept_text = len(paragraphs), len(sink) if sink is not None else 0
+            child_text, child_links = _bs4_walk(child, junk, paragraphs, sink)
+            if junk.too_linky(child.name, child_text, child_links, len(paragraphs) > kept_paragraphs):
+                del paragraphs[kept_paragraphs:]
+                if sink is not None:
+                    del sink[kept_text:]
+            else:
+                text_len += child_text
+                link_len += child_links
+        elif type(child) in (NavigableString, CData):   # What get_text() counts (no comments)
+            text_len += _visible_len(child)
+            if sink is not None and not sink.closed:
+                sink.append(str(child))
+    if node.name == "a":
+        link_len = text_len
+    if sink is not outer:
+        paragraphs[slot] = "".join(sink)
+    return text_len, link_len
+
+
+def _bs4_paragraphs(html, containers, junk):
+    soup = BeautifulSoup(html, "html.parser")
+    content = None
+    for tag, cls in containers:
+        content = soup.find(tag, class_=cls) if cls else soup.find(tag)
+        if content: break
+    if not content:
+        return None
+    paragraphs = []
+    _bs4_walk(content, junk, paragraphs, None)
+    return paragraphs
+
+
+def _class_xpath(tag, cls):
+    if not cls:
+        return f"//{tag}"
+    return f"//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]"
+
+
+def _lxml_paragraphs(html, containers, junk):
+    markup = html
+    if isinstance(markup, bytes):
+        # Same charset sniffing BeautifulSoup does, otherwise lxml assumes latin-1
+        markup = UnicodeDammit(markup, is_html=True).unicode_markup
+    # lxml refuses str input that declares an encoding (<?xml ... encoding=...?>)
+    markup = _XML_DECLARATION.sub("", markup)
+    try:
+        root = lxml.html.fromstring(markup)
+    except (etree.ParserError, ValueError):
+        return _bs4_paragraphs(html, containers, junk)
+    content = None
+    for tag, cls in containers:
+        found = root.xpath(_class_xpath(tag, cls))
+        if found:
+            content = found[0]
+            break
+    if content is None:
+        return None
+    paragraphs = []
+    _lxml_walk(content, junk, paragraphs, None)
+    return paragraphs
+
+
+def extract_text(html, containers, junk_tags=DEFAULT_JUNK, min_paragraph_len=0, backend=None):
+    # Joined <p> text of the first matching container ("" if none), minus boilerplate
+    # subtrees (see JunkFilter). Not whitespace-cleaned.
+    backend = backend or DEFAULT_BACKEND
+    junk = junk_filter(junk_tags)
+    if backend == "lxml" and HAS_LXML:
+        paragraphs = _lxml_paragraphs(html, containers, junk)
+    else:
+        paragraphs = _bs4_paragraphs(html, containers, junk)
+    if paragraphs is None:
+        return ""
+    if min_paragraph_len:
+        return " ".join(t for t in paragraphs if len(t) > min_paragraph_len)
+    return " ".join(paragraphs)
+
+
+# ==========================================
+# 🔬 PARITY CHECK
+# ==========================================
+def _normalize(text):
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def cached_pages(cache_dir="http_cache"):
+    for path in glob.glob(os.path.join(cache_dir, "*", "*.json.gz")):
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+            yield entry["url"], entry_content(entry)
+        except (OSError, ValueError, KeyError):
+            continue
+
+
+SAMPLE_TEMPLATE = """<html><head><title>{title}</title><script>var x = "<p>not text</p>";</script></head>
+<body><nav><p>Menu &amp; links</p></nav>
+<article><div class="post-content entry-content uk-article-content">
+<p>{first}</p><!-- ad slot --><script>ads()</script>
+{rest}
+<div class="share-bar"><p>Share this: Facebook &middot; X</p></div>
+</div></article><footer><p>© footer</p></footer></body></html>"""
+
+
+# Markup the two parsers build different trees for; both must still agree
+EDGE_CASES = [
+    ("xml-declaration (str)", '<?xml version="1.0" encoding="utf-8"?>\n' + SAMPLE_TEMPLATE.format(
+        title="Declared", first="Pages served as XHTML start with an encoding declaration.", rest="")),
+    ("xml-declaration (bytes)", ('<?xml version="1.0" encoding="utf-8"?>\n' + SAMPLE_TEMPLATE.format(
+        title="Declared", first="Ang balita ay na-update ngayong araw — ñ, é.", rest="")).encode("utf-8")),
+    ("nested <p>", SAMPLE_TEMPLATE.format(title="Nested", first="one<p>two</p>",
+                                          rest="<p>three<b>bold<p>four</p>after</b>tail</p><p>five</p>")),
+    ("linky wrapper", SAMPLE_TEMPLATE.format(title="Wrapper", first="Body.", rest=(
+        "<div class='uk-margin-large-top'><p>A real closing paragraph inside a mostly-link wrapper.</p>"
+        + "".join(f"<a href='/{i}'>Related story number {i} headline</a> " for i in range(8))
+        + "<ul><li><a href='/tag'>Tag</a></li></ul></div>"))),
+]
+
+
+def sample_pages(csv_path, limit=50):
+    # Wrap real dataset rows in a WordPress-like article page
+    with open(csv_path, encoding="utf-8-sig", newline="") as f:
+        for i, row in enumerate(csv.DictReader(f)):
+            if i >= limit: break
+            sentences = [html_lib.escape(s) for s in re.split(r'(?<=\.) ', row["text"])]
+            rest = "\n".join(f"<p>{s[:40]}<em>{s[40:80]}</em>{s[80:]}<br/></p>" for s in sentences[1:])
+            page = SAMPLE_TEMPLATE.format(title=html_lib.escape(row["title"]), first=sentences[0], rest=rest)
+            yield f"{os.path.basename(csv_path)}#{i}", page.encode("utf-8")
+
+
+def parity_check(pages):
+    # pages: iterable of (name, html). Returns list of (name, site, bs4_text, lxml_text) mismatches.
+    mismatches = []
+    checked = 0
+    for name, html in pages:
+        for site, containers in ARTICLE_CONTAINERS.items():
+            a = _normalize(extract_text(html, containers, backend="bs4"))
+            b = _normalize(extract_text(html, containers, backend="lxml"))
+            checked += 1
+            if a != b:
+                mismatches.append((name, site, a, b))
+    print(f"🔬 Parity: {checked - len(mismatches)}/{checked} page/site combinations identical")
+    return mismatches
+
+
+if __name__ == "__main__":
+    if not HAS_LXML:
+        sys.exit("❌ lxml is not installed, nothing to compare against.")
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    files = sys.argv[1:] or [os.path.join(here, "..", "debug_source.html")]
+    pages = []
+    for path in files:
+        with open(path, "rb") as f:
+            pages.append((path, f.read()))
+    pages.extend(EDGE_CASES)
+    pages.extend(cached_pages())
+    for csv_path in glob.glob(os.path.join(here, "..", "*_Full_Dataset.csv")):
+        pages.extend(sample_pages(csv_path))
+
+    bad = parity_check(pages)
+    for name, site, a, b in bad[:10]:
+        print(f"   ❌ {name} [{site}]\n      bs4 : {a[:120]}\n      lxml: {b[:120]}")
+    sys.exit(1 if bad else 0)
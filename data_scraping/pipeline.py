@@ -0,0 +1,160 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# ==========================================
+# 🏭 FETCH -> PARSE PIPELINE
+# ==========================================
+# BeautifulSoup + html.parser is pure Python and holds the GIL, so parsing on
+# the fetch threads serializes everything behind one core. Here the network
+# stage (threads) only downloads raw bytes and drops them on a bounded queue;
+# a dispatcher hands them to a ProcessPoolExecutor for parsing/extraction.
+#
+#   fetch threads --(bounded queue)--> dispatcher --> parse processes
+#
+# If the parsers fall behind, the queue fills and the fetchers block, so
+# memory stays bounded. At most `window` items (default: fetch_workers) are
+# between submission and the caller at once, fewer if `limit()` says fewer
+# rows are still wanted, so stopping early never leaves a page's worth of
+# downloads behind. `extract` must be a module-level function (picklable).
+
+_DONE = object()
+
+
+def _timed(extract, raw):
+    # Runs in the parse process; the time comes back with the result
+    start = time.perf_counter()
+    value = extract(raw)
+    return value, time.perf_counter() - start
+
+
+class FetchParsePipeline:
+    def __init__(self, fetch, extract, fetch_workers=4, parse_workers=None, queue_size=16,
+                 metrics=None, labels=None, window=None):
+        self.fetch = fetch
+        self.extract = extract
+        self.fetch_workers = fetch_workers
+        self.window = window or fetch_workers
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.metrics = metrics   # Optional metrics.Metrics: parse_seconds, queue depth, in-flight parses
+        self.labels = labels or {}
+        self.fetch_pool = ThreadPoolExecutor(max_workers=fetch_workers)
+        self.parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+
+    def run(self, items, limit=None):
+        """Yield (item, extracted) for every item, roughly in fetch-completion order.
+
+        limit: optional callable -> how many more results the caller wants;
+        no more than that many items are fetched ahead of the caller.
+        Stop iterating at any time (e.g. target_count reached); queued
+        fetches are cancelled and in-flight ones are discarded.
+        """
+        items = list(items)
+        if not items:
+            return
+        handoff = queue.Queue(maxsize=self.queue_size)
+        results = queue.Queue()
+        parse_slots = threading.Semaphore(self.parse_workers * 2)
+        stop = threading.Event()
+        in_flight = [0]
+        slots = threading.Condition()
+        fetch_futures = []
+
+        def room():
+            if limit is None:
+                return self.window
+            return min(self.window, max(limit(), 1))
+
+        def feed():
+            # Submits fetches as results are handed back, like the old fetch_pool.bounded_map
+            for item in items:
+                with slots:
+                    while in_flight[0] >= room():
+                        if stop.is_set():
+                            return
+                        slots.wait(0.1)
+                    if stop.is_set():
+                        return
+                    in_flight[0] += 1
+                    fetch_futures.append(self.fetch_pool.submit(fetch_one, item))
+
+        def handed_back():
+            with slots:
+                in_flight[0] -= 1
+                slots.notify()
+
+        def fetch_one(item):
+            if stop.is_set():
+                return
+            try:
+                raw = self.fetch(item)
+            except Exception:
+                raw = None
+            while not stop.is_set():
+                try:
+                    handoff.put((item, raw), timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def dispatch():
+            for _ in range(len(items)):
+                while True:
+                    if stop.is_set():
+                        return
+                    try:
+                        item, raw = handoff.get(timeout=0.1)
+                        break
+                    except queue.Empty:
+                        continue
+                if raw is None:
+                    results.put((item, None))
+                    continue
+                while not parse_slots.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                if self.metrics:
+                    self.metrics.set("handoff_queue_depth", handoff.qsize(), **self.labels)
+                    self.metrics.add("parse_in_flight", 1, **self.labels)
+                results.put((item, self.parse_pool.submit(_timed, self.extract, raw)))
+            results.put(_DONE)
+
+        feeder = threading.Thread(target=feed, daemon=True)
+        dispatcher = threading.Thread(target=dispatch, daemon=True)
+        feeder.start()
+        dispatcher.start()
+        try:
+            while True:
+                entry = results.get()
+                if entry is _DONE:
+                    break
+                item, future = entry
+                if future is None:
+                    yield item, None
+                    handed_back()
+                    continue
+                try:
+                    value, seconds = future.result()
+                    if self.metrics:
+                        self.metrics.observe("parse_seconds", seconds, **self.labels)
+                except Exception:
+                    value = None
+                finally:
+                    parse_slots.release()
+                    if self.metrics:
+                        self.metrics.add("parse_in_flight", -1, **self.labels)
+                yield item, value
+                handed_back()
+        finally:
+            stop.set()
+            feeder.join()
+            for future in fetch_futures:
+                future.cancel()
+            dispatcher.join()
+
+    def close(self):
+        self.fetch_pool.shutdown(wait=True, cancel_futures=True)
+        self.parse_pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,78 @@
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+from collections import Counter
+
+from dataset_writer import DatasetWriter, read_rows
+
+# ==========================================
+# 🔀 SHUFFLE / BALANCE POST-PROCESSING
+# ==========================================
+# Runs after the crawl, on the file the DatasetWriter streamed out. Replaces
+# the old `pd.concat(...).sample(frac=1)` without loading the corpus:
+#
+#   1. count rows per label (one streaming pass, only counters in memory)
+#   2. balance=True: pick which row numbers to keep per label (ints only)
+#   3. scatter rows into random temporary buckets of ~rows_per_bucket rows
+#   4. shuffle each bucket in memory and append it to the output
+#
+# Peak memory is one bucket, not the whole dataset.
+#
+#   python postprocess.py rappler_rows.jsonl Rappler_Full_Dataset.csv [--balance]
+#   python postprocess.py rappler_rows.jsonl Rappler_Full_Dataset.arrow   # columnar, mmap-able
+
+
+def label_counts(path):
+    return Counter(row["label"] for row in read_rows(path))
+
+
+def shuffle_dataset(src, dst, balance=False, seed=42, rows_per_bucket=2000):
+    rng = random.Random(seed)
+    counts = label_counts(src)
+
+    keep = None
+    total = sum(counts.values())
+    if balance and counts:
+        # Downsample every label to the smallest one
+        target = min(counts.values())
+        keep = {label: set(rng.sample(range(n), target)) for label, n in counts.items()}
+        total = target * len(counts)
+
+    n_buckets = max(1, -(-total // rows_per_bucket))
+    tmp_dir = tempfile.mkdtemp(prefix="shuffle_", dir=os.path.dirname(os.path.abspath(dst)))
+    written = Counter()
+    try:
+        buckets = [open(os.path.join(tmp_dir, f"{i}.jsonl"), "w", encoding="utf-8") for i in range(n_buckets)]
+        seen = Counter()
+        for row in read_rows(src):
+            label = row["label"]
+            position = seen[label]
+            seen[label] += 1
+            if keep is not None and position not in keep[label]:
+                continue
+            rng.choice(buckets).write(json.dumps(row, ensure_ascii=False) + "\n")
+        for f in buckets:
+            f.close()
+
+        with DatasetWriter(dst) as sink:
+            for f in buckets:
+                rows = list(read_rows(f.name))
+                rng.shuffle(rows)
+                sink.write_many(rows)
+                written.update(row["label"] for row in rows)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return written
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python postprocess.py <rows file> <output file> [--balance]")
+        sys.exit(1)
+    written = shuffle_dataset(sys.argv[1], sys.argv[2], balance="--balance" in sys.argv)
+    print(f"🎉 Saved {sum(written.values())} shuffled rows to {sys.argv[2]}")
+    for label, n in written.most_common():
+        print(f"   {label}: {n}")
@@ -0,0 +1,153 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+# ==========================================
+# 🚦 PER-HOST POLITENESS LIMITER
+# ==========================================
+# Replaces the hard-coded time.sleep() calls in get_soup. Each host gets its
+# own token bucket, so several worker threads can share one limiter and the
+# site still never sees more than `rate` requests per second on average.
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity=1):
+        self.rate = float(rate)          # tokens added per second
+        self.capacity = float(capacity)  # max burst size
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            # Sleep outside the lock so other threads can refill/check
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    def __init__(self, rate=0.5, burst=1, overrides=None):
+        self.rate = rate
+        self.burst = burst
+        self.overrides = overrides or {}  # {"www.rappler.com": (rate, burst)}
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def bucket_for(self, host):
+        with self.lock:
+            if host not in self.buckets:
+                rate, burst = self.overrides.get(host, (self.rate, self.burst))
+                self.buckets[host] = TokenBucket(rate, burst)
+            return self.buckets[host]
+
+    def wait(self, url):
+        host = urlparse(url).netloc.lower()
+        self.bucket_for(host).acquire()
+
+
+# ==========================================
+# 📈 ADAPTIVE (FEEDBACK-DRIVEN) THROTTLE
+# ==========================================
+# Same per-host token buckets, but the rate moves with what the site tells us:
+#
+#   healthy response (2xx/3xx/404)  -> rate += 5% (up to max_rate)
+#   slow responses (EWMA latency)   -> rate -= 20%
+#   403 / 429 / 5xx / conn. error   -> rate halved, host paused for Retry-After
+#                                      or an exponential, jittered cooldown
+#
+# We start at the old fixed-sleep pace and only go faster while the site is
+# happy, so the block rate shouldn't get worse than it was.
+
+BLOCK_STATUSES = {403, 429}
+
+
+def backoff_delay(attempt, base=1.0, cap=60.0):
+    # Exponential backoff with "full jitter": uniform(0, min(cap, base * 2**attempt))
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def parse_retry_after(value):
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+        return max(0.0, when.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveThrottle(HostRateLimiter):
+    def __init__(self, rate=0.5, burst=1, max_rate=None, min_rate=None,
+                 cooldown=10.0, max_cooldown=300.0, slow_latency=5.0):
+        super().__init__(rate=rate, burst=burst)
+        self.max_rate = max_rate or rate * 4
+        self.min_rate = min_rate or rate / 8
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.slow_latency = slow_latency
+        self.state = {}   # host -> {"strikes", "paused_until", "latency"}
+        self.blocks = 0
+        self.responses = 0
+
+    def host_state(self, host):
+        with self.lock:
+            return self.state.setdefault(host, {"strikes": 0, "paused_until": 0.0, "latency": None})
+
+    def wait(self, url):
+        host = urlparse(url).netloc.lower()
+        pause = self.host_state(host)["paused_until"] - time.monotonic()
+        if pause > 0:
+            time.sleep(pause)
+        self.bucket_for(host).acquire()
+
+    def set_rate(self, host, rate):
+        bucket = self.bucket_for(host)
+        with bucket.lock:
+            bucket._refill()
+            bucket.rate = min(self.max_rate, max(self.min_rate, rate))
+
+    def current_rate(self, url):
+        return self.bucket_for(urlparse(url).netloc.lower()).rate
+
+    def record(self, url, status, latency=None, retry_after=None):
+        # status=None means the request failed outright (timeout, reset, ...)
+        host = urlparse(url).netloc.lower()
+        state = self.host_state(host)
+        rate = self.bucket_for(host).rate
+        self.responses += 1
+
+        if status is None or status in BLOCK_STATUSES or status >= 500:
+            self.blocks += 1
+            with self.lock:
+                state["strikes"] += 1
+                wait = parse_retry_after(retry_after)
+                if wait is None:
+                    wait = self.cooldown * (2 ** (state["strikes"] - 1))
+                    wait = min(self.max_cooldown, wait) * random.uniform(0.5, 1.0)
+                state["paused_until"] = max(state["paused_until"], time.monotonic() + wait)
+            self.set_rate(host, rate / 2)
+            return
+
+        with self.lock:
+            state["strikes"] = 0
+            if latency is not None:
+                prev = state["latency"]
+                state["latency"] = latency if prev is None else 0.8 * prev + 0.2 * latency
+            slow = state["latency"] is not None and state["latency"] > self.slow_latency
+        self.set_rate(host, rate * (0.8 if slow else 1.05))
@@ -0,0 +1,238 @@
+import math
+import os
+import sys
+import threading
+import time
+
+from dataset_writer import DatasetWriter
+from postprocess import shuffle_dataset
+
+# ==========================================
+# 👇 CONFIGURATION 👇
+# ==========================================
+TARGET_SAMPLES_PER_CLASS = 3000   # Across all outlets
+MAX_SHARE = None                  # e.g. 0.5: no outlet supplies more than half of a class
+ROWS_FILE = "all_sources_rows.jsonl"         # Accepted rows from every outlet, streamed during the crawl
+OUTPUT_FILE = "All_Sources_Dataset.csv"      # Shuffled, class-balanced final dataset
+# ==========================================
+
+# ==========================================
+# 🗓️ MULTI-SOURCE CRAWL SCHEDULER
+# ==========================================
+# Each scraper module used to fill "fake" completely, then "true", one source
+# after another, with its own hard-coded TARGET_SAMPLES_PER_CLASS. This runs
+# every (outlet, class) pair as its own lane, all at once (each outlet keeps
+# its own per-host throttle, so lanes of different outlets never slow each
+# other down), against one target per class:
+#
+#   - every lane gets a cap (its share of what the class still needs); a lane
+#     at its cap parks until the caps move or the class is full
+#   - a row is reserved (acquire) before it's written and either accepted or
+#     released, so concurrent lanes never overshoot a class target
+#   - shares follow throughput: the remaining rows of a class are split in
+#     proportion to each lane's smoothed rows/second (time spent parked
+#     doesn't count), so all lanes of a class head for the same finish time
+#   - a lane whose outlet runs dry hands its share to the others
+#   - when every lane of a class is done short of the target, the other
+#     class's target drops to match, so the corpus stays balanced
+#
+#   python scheduler.py                      # all outlets, TARGET_SAMPLES_PER_CLASS each class
+#   python scheduler.py 500 Rappler MindaNews
+
+PRIOR_ROWS = 1.0        # Smoothing: a lane with no history counts as 1 row per 10 s
+PRIOR_SECONDS = 10.0
+PARK_TIMEOUT = 1.0      # Parked lanes re-check their caps this often
+
+
+class Lane:
+    # One (outlet, class) pair; handed to CrawlEngine.scrape_section as `quota`
+    def __init__(self, scheduler, source, category):
+        self.scheduler = scheduler
+        self.source = source
+        self.category = category
+        self.accepted = 0
+        self.reserved = 0    # Acquired, not yet accepted or released
+        self.cap = 0
+        self.started = time.monotonic()
+        self.parked = 0.0
+        self.finished = False
+
+    def rate(self):
+        active = time.monotonic() - self.started - self.parked
+        return (self.accepted + PRIOR_ROWS) / (max(active, 0.0) + PRIOR_SECONDS)
+
+    def wanted(self):
+        return not self.scheduler.full(self.category)
+
+    def remaining(self):
+        return self.scheduler.remaining(self.category)
+
+    def claimed(self):
+        return self.accepted + self.reserved
+
+    def acquire(self):
+        # Reserves one row; blocks while this lane is at its cap. False = the class is full, stop.
+        return self.scheduler.acquire(self)
+
+    def accept(self, n=1):
+        self.scheduler.accept(self, n)
+
+    def release(self):
+        # Give back a reserved row that wasn't written
+        self.scheduler.release(self)
+
+
+class CrawlScheduler:
+    def __init__(self, engines, target_per_class, max_share=None):
+        self.engines = {engine.source: engine for engine in engines}
+        self.targets = {}
+        self.max_share = max_share
+        self.cond = threading.Condition()
+        self.lanes = []
+        for engine in engines:
+            for category, sections in engine.urls.items():
+                if sections:
+                    self.lanes.append(Lane(self, engine.source, category))
+                    self.targets[category] = target_per_class
+        for category in self.targets:
+            self.rebalance(category)
+
+    # ---------- Quotas (all called with or under self.cond) ----------
+    def class_lanes(self, category):
+        return [lane for lane in self.lanes if lane.category == category]
+
+    def total(self, category):
+        # Reserved rows count, so a class can't be overfilled by lanes acquiring at once
+        return sum(lane.claimed() for lane in self.class_lanes(category))
+
+    def full(self, category):
+        return self.total(category) >= self.targets[category]
+
+    def remaining(self, category):
+        with self.cond:
+            return max(self.targets[category] - self.total(category), 0)
+
+    def rebalance(self, category):
+        # Split what the class still needs over its live lanes, by throughput
+        lanes = self.class_lanes(category)
+        target = self.targets[category]
+        remaining = max(target - self.total(category), 0)
+        active = [lane for lane in lanes if not lane.finished]
+        weights = {id(lane): lane.rate() for lane in active}
+        total_weight = sum(weights.values()) or 1.0
+        caps = {id(lane): lane.claimed() + math.ceil(remaining * weights[id(lane)] / total_weight)
+                for lane in active}
+        if self.max_share is not None:
+            limit = math.ceil(target * self.max_share)
+            limited = {id(lane): min(caps[id(lane)], max(limit, lane.claimed())) for lane in active}
+            # Only while the others can still make up the difference
+            if sum(limited.values()) + sum(lane.claimed() for lane in lanes if lane.finished) >= target:
+                caps = limited
+        for lane in lanes:
+            lane.cap = caps.get(id(lane), lane.claimed())
+
+    def acquire(self, lane):
+        with self.cond:
+            while not self.full(lane.category) and lane.claimed() >= lane.cap:
+                parked_at = time.monotonic()
+                self.cond.wait(PARK_TIMEOUT)
+                lane.parked += time.monotonic() - parked_at
+                self.rebalance(lane.category)
+            if self.full(lane.category):
+                return False
+            lane.reserved += 1
+            return True
+
+    def accept(self, lane, n):
+        # Turns reservations into rows (rows restored from a checkpoint come unreserved)
+        with self.cond:
+            lane.reserved -= min(n, lane.reserved)
+            lane.accepted += n
+            self.rebalance(lane.category)
+            self.cond.notify_all()
+
+    def release(self, lane):
+        with self.cond:
+            lane.reserved -= 1
+            self.rebalance(lane.category)
+            self.cond.notify_all()
+
+    def finish(self, lane):
+        with self.cond:
+            lane.finished = True
+            lanes = self.class_lanes(lane.category)
+            if all(l.finished for l in lanes):
+                # Class ran dry: cap the other classes at what it reached
+                reached = self.total(lane.category)
+                for category in self.targets:
+                    if category != lane.category and reached < self.targets[category]:
+                        print(f"   ⚖️  '{lane.category}' ran dry at {reached}; "
+                              f"'{category}' target {self.targets[category]} -> {reached}")
+                        self.targets[category] = reached
+            for category in self.targets:
+                self.rebalance(category)
+            self.cond.notify_all()
+
+    # ---------- Running ----------
+    def run_lane(self, lane, sink):
+        engine = self.engines[lane.source]
+        lane.started = time.monotonic()
+        try:
+            engine.scrape_section(lane.category, None, sink=sink, quota=lane)
+        except Exception as e:
+            print(f"   ❌ {lane.source} '{lane.category}' lane failed: {e}")
+        finally:
+            self.finish(lane)
+
+    def run(self, output_file):
+        # -> {(source, class): rows}
+        # One parse process pool per lane; split the cores instead of giving each lane all of them
+        for engine in self.engines.values():
+            if engine.parse_workers is None:
+                engine.parse_workers = max(1, (os.cpu_count() or 1) // len(self.lanes))
+
+        start = time.monotonic()
+        with DatasetWriter(output_file) as sink:
+            threads = [threading.Thread(target=self.run_lane, args=(lane, sink),
+                                        name=f"{lane.source}-{lane.category}", daemon=True)
+                       for lane in self.lanes]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        for engine in self.engines.values():
+            engine.metrics.flush()
+
+        print("\n" + "="*40)
+        print(f"📊 SCHEDULED CRAWL ({time.monotonic() - start:.0f}s):")
+        for category in self.targets:
+            print(f"   {category}: {self.total(category)}/{self.targets[category]}")
+            for lane in self.class_lanes(category):
+                print(f"      {lane.source:<12} {lane.accepted:>6}  ({lane.rate() * 60:.1f} rows/min)")
+        print("="*40)
+        return {(lane.source, lane.category): lane.accepted for lane in self.lanes}
+
+
+def default_engines(names=None):
+    # The engine-based scrapers with their module configs (the Selenium VeraFiles scraper isn't one)
+    from mindanews import MindaNewsScraper
+    from pressone import PressOneHarvester
+    from rappler import RapplerScraper
+    from verafiles2 import VeraFilesScraper
+
+    factories = {"Rappler": RapplerScraper, "MindaNews": MindaNewsScraper,
+                 "PressOne.PH": PressOneHarvester, "Vera Files": VeraFilesScraper}
+    return [factory() for name, factory in factories.items() if not names or name in names]
+
+
+if __name__ == "__main__":
+    target = int(sys.argv[1]) if len(sys.argv) > 1 else TARGET_SAMPLES_PER_CLASS
+    scheduler = CrawlScheduler(default_engines(sys.argv[2:]), target, max_share=MAX_SHARE)
+    counts = scheduler.run(ROWS_FILE)
+
+    if sum(counts.values()):
+        written = shuffle_dataset(ROWS_FILE, OUTPUT_FILE, balance=True)
+        print(f"\n🎉 SUCCESS! Saved {sum(written.values())} rows to {OUTPUT_FILE}")
+        for label, n in written.most_common(): print(f"   {label}: {n}")
+    else:
+        print("\n❌ No data collected.")
@@ -0,0 +1,111 @@
+import atexit
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+
+# ==========================================
+# 🍪 BROWSER-ASSISTED SESSION BOOTSTRAP
+# ==========================================
+# Rendering every VeraFiles article in Chrome is ~10x slower than a plain GET,
+# but plain GETs hit Deflect's 403 wall. Middle ground: let a real browser
+# pass the challenge once, copy its cookies + User-Agent into a normal pooled
+# requests.Session, and only go back to the browser when a 403 shows up again
+# (clearance cookie expired).
+#
+#   session = BrowserSession(SeleniumSolver(make_driver))
+#   session.get(url)   # 403 -> solve in Chrome -> retry with fresh cookies
+#
+# Try it without the real site: `python mock_server.py --challenge` serves a
+# stand-in that hands out challenge cookies (see the __main__ below).
+
+
+class SeleniumSolver:
+    # Callable: solve(url) -> (cookies, user_agent). Keeps one browser around for refreshes.
+    def __init__(self, make_driver, ready=None, timeout=60):
+        self.make_driver = make_driver
+        self.ready = ready or (lambda d: "403" not in d.title)
+        self.timeout = timeout
+        self.driver = None
+        atexit.register(self.close)
+
+    def __call__(self, url):
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        if self.driver is None:
+            self.driver = self.make_driver()
+        self.driver.get(url)
+        WebDriverWait(self.driver, self.timeout).until(self.ready)
+        return self.driver.get_cookies(), self.driver.execute_script("return navigator.userAgent")
+
+    def close(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+
+
+class BrowserSession(requests.Session):
+    def __init__(self, solve, challenge_statuses=(403, 503), max_refreshes=20):
+        super().__init__()
+        self.solve = solve
+        self.challenge_statuses = challenge_statuses
+        self.max_refreshes = max_refreshes
+        self.refreshes = 0
+        self.generation = 0   # Bumped on every refresh, so N threads that 403 at once solve only once
+        self.refresh_lock = threading.Lock()
+
+    def refresh(self, url, seen_generation):
+        with self.refresh_lock:
+            if self.generation != seen_generation:
+                return True  # Another thread already got fresh cookies
+            if self.refreshes >= self.max_refreshes:
+                return False
+            print(f"      🍪 Challenge at {url}. Solving it in the browser...")
+            cookies, user_agent = self.solve(url)
+            host = urlparse(url).hostname
+            for c in cookies:
+                self.cookies.set(c["name"], c["value"], domain=c.get("domain") or host, path=c.get("path", "/"))
+            # Clearance is usually tied to the UA that solved it
+            self.headers["User-Agent"] = user_agent
+            self.refreshes += 1
+            self.generation += 1
+            return True
+
+    def request(self, method, url, *args, **kwargs):
+        seen_generation = self.generation
+        response = super().request(method, url, *args, **kwargs)
+        if response.status_code in self.challenge_statuses:
+            if self.refresh(url, seen_generation):
+                # Drop our stale per-request UA, if any, so the solved one is used
+                headers = dict(kwargs.pop("headers", None) or {})
+                headers.pop("User-Agent", None)
+                response = super().request(method, url, *args, headers=headers, **kwargs)
+        return response
+
+    def close(self):
+        close = getattr(self.solve, "close", None)
+        if close: close()
+        super().close()
+
+
+if __name__ == "__main__":
+    # Demo against the local stand-in (no Chrome needed: its challenge is solved by script)
+    from mock_server import MockNewsServer, solve_mock_challenge
+
+    server = MockNewsServer(challenge=True, token_ttl=2)
+    base_url = server.start()
+    session = BrowserSession(solve_mock_challenge)
+    try:
+        print(f"🧪 Stand-in server at {base_url}")
+        for i in range(6):
+            r = session.get(f"{base_url}/articles/{i}")
+            print(f"   GET /articles/{i} -> {r.status_code} (browser solves so far: {session.refreshes})")
+            if i == 2:
+                time.sleep(2.5)  # Let the clearance cookie expire -> browser re-engaged once
+    finally:
+        session.close()
+        server.stop()
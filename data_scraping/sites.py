@@ -0,0 +1,176 @@
+from parsers import ARTICLE_CONTAINERS
+
+# ==========================================
+# 🗺️ SITE SPECS
+# ==========================================
+# Everything that used to differ between the copy-pasted scraper classes.
+# engine.CrawlEngine does the rest (fetching, politeness, caching, dedup,
+# checkpoints, parsing). Adding an outlet = adding a dict here.
+#
+#   name             -> value of the "source" column
+#   client           -> "requests", "cloudscraper" or "browser" (session_bootstrap.py)
+#   sections         -> start URLs per class ("fake" / "true")
+#   pagination       -> URL for page N >= 2, formatted with {base} and {page}
+#   listing          -> "headers": links inside the first non-empty (tag, class) group
+#                       "anchors": every <a href> on the page (PressOne harvester)
+#   requests_per_second / burst -> starting pace of the per-host adaptive throttle
+#   max_requests_per_second     -> ceiling it may speed up to while the site is healthy
+#   blocked_wait     -> first cooldown after a 403/429 (doubles on repeats)
+#   max_pages / max_empty_pages -> hard caps; the engine normally stops earlier on
+#                      a 404, a redirect or a repeated listing (see ListingPrefetcher)
+#   min_title_len / href_prefix / href_contains_any / href_excludes / must_contain /
+#   skip_title_pattern -> listing link rules, compiled by linkfilter.LinkClassifier
+#   feeds            -> RSS/Atom feeds or sitemaps per class, for delta crawls (feeds.py)
+#   feed_must_contain / feed_must_not_contain -> sort shared sitemap URLs into a class
+#   junk_tags        -> CSS selectors ("script", "div.share-bar", ".sharedaddy") whose subtrees
+#                       are dropped before text extraction (parsers.JunkFilter)
+#   boilerplate      -> regexes stripped from the extracted text (textclean.py)
+
+BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8"
+}
+
+RAPPLER = {
+    "name": "Rappler",
+    "client": "requests",
+    "headers": BROWSER_HEADERS,
+    "sections": {
+        "fake": ["https://www.rappler.com/section/newsbreak/fact-check/"],
+        "true": [
+            "https://www.rappler.com/section/nation/",
+            "https://www.rappler.com/section/business/",
+            "https://www.rappler.com/section/life-and-style/"
+        ]
+    },
+    "feeds": {
+        "fake": ["https://www.rappler.com/section/newsbreak/fact-check/feed/"],
+        "true": [
+            "https://www.rappler.com/section/nation/feed/",
+            "https://www.rappler.com/section/business/feed/",
+            "https://www.rappler.com/section/life-and-style/feed/"
+        ]
+    },
+    "pagination": "{base}page/{page}/",
+    "listing": "headers",
+    "header_tags": [("h3", None)],
+    "min_title_len": 21,
+    "href_prefix": "https://www.rappler.com/",
+    "containers": ARTICLE_CONTAINERS["Rappler"],
+    "junk_tags": ['script', 'style', 'div.share-bar'],
+    "boilerplate": [],
+    "min_text_len": 151,
+    "requests_per_second": 0.5,   # Rappler needs slow requests
+    "max_requests_per_second": 2,
+    "burst": 2,
+    "timeout": 25,
+    "max_pages": 50,
+    "max_empty_pages": 3,
+}
+
+MINDANEWS = {
+    "name": "MindaNews",
+    "client": "cloudscraper",
+    "base_domain": "https://mindanews.com",
+    "sections": {
+        "fake": ["https://mindanews.com/category/fact-check/"],
+        "true": [
+            "https://mindanews.com/category/top-stories/",
+            "https://mindanews.com/category/peace-process/",
+            "https://mindanews.com/category/environment/",
+            "https://mindanews.com/category/business/"
+        ]
+    },
+    "feeds": {
+        "fake": ["https://mindanews.com/category/fact-check/feed/"],
+        "true": [
+            "https://mindanews.com/category/top-stories/feed/",
+            "https://mindanews.com/category/peace-process/feed/",
+            "https://mindanews.com/category/environment/feed/",
+            "https://mindanews.com/category/business/feed/"
+        ]
+    },
+    "pagination": "{base}page/{page}/",   # WordPress
+    "listing": "headers",
+    "header_tags": [("h2", "entry-title")],
+    "min_title_len": 11,
+    # Don't fetch photo captions ("PHOTO: ..." with a short title)
+    "skip_title_pattern": "photo",
+    "skip_title_max_len": 19,
+    "containers": ARTICLE_CONTAINERS["MindaNews"],
+    "junk_tags": ['script', 'style', 'div.sharedaddy', 'div.jp-relatedposts'],
+    "boilerplate": [r'MindaNews is the news service arm.*', r'READ ALSO.*'],
+    "min_text_len": 151,
+    "requests_per_second": 1 / 3,
+    "max_requests_per_second": 1,
+    "burst": 1,
+    "blocked_wait": 10,
+    "max_pages": 30,
+    "max_empty_pages": 3,
+}
+
+PRESSONE = {
+    "name": "PressOne.PH",
+    "client": "cloudscraper",
+    "base_domain": "https://pressone.ph",
+    "sections": {
+        "fake": ["https://pressone.ph/fact-check/"],
+        "true": ["https://pressone.ph/news/", "https://pressone.ph/opinion/"]
+    },
+    "feeds": {
+        "fake": ["https://pressone.ph/fact-check/feed/"],
+        "true": ["https://pressone.ph/news/feed/", "https://pressone.ph/opinion/feed/"]
+    },
+    "pagination": "{base}page/{page}/",
+    "listing": "anchors",
+    "href_excludes": ['/page/', '/category/', '/tag/', '/author/', '#'],
+    # Fact-check links must live under /fact-check/, news is looser
+    "must_contain": {"fake": "/fact-check/", "true": ""},
+    "min_title_len": 25,   # Real headlines are usually 25+ characters
+    "containers": ARTICLE_CONTAINERS["PressOne.PH"],
+    "junk_tags": ['script', 'style', 'div.sharedaddy', 'div.jp-relatedposts'],
+    "boilerplate": [r'Follow us on.*', r'Editor’s Note:.*'],
+    "min_text_len": 151,
+    "requests_per_second": 0.5,
+    "max_requests_per_second": 1.5,
+    "burst": 1,
+    "max_pages": 150,
+    "max_empty_pages": 4,
+}
+
+VERAFILES = {
+    "name": "Vera Files",
+    "client": "cloudscraper",   # Bypasses Deflect most of the time
+    "base_domain": "https://verafiles.org",
+    "sections": {
+        "fake": ["https://verafiles.org/articles/category/fact-check"],
+        "true": [
+            "https://verafiles.org/articles/category/news",
+            "https://verafiles.org/articles/category/features"
+        ]
+    },
+    # No RSS; one sitemap for everything, split by URL
+    "feeds": {
+        "fake": ["https://verafiles.org/sitemap.xml"],
+        "true": ["https://verafiles.org/sitemap.xml"]
+    },
+    "feed_must_contain": {"fake": "fact-check"},
+    "feed_must_not_contain": {"true": ["fact-check", "/category/"]},
+    "pagination": "{base}?page={page}",
+    "listing": "headers",
+    "header_tags": [("h2", "uk-card-title"), ("h3", "uk-card-title"), ("h3", None)],
+    "min_title_len": 6,
+    "href_contains_any": ["/articles/", "/news/"],
+    "containers": ARTICLE_CONTAINERS["Vera Files"],
+    "junk_tags": ['script', 'style', 'div.share-bar'],   # Link lists below the text go by link density
+    "boilerplate": [r'VERA FILES'],
+    "min_text_len": 101,
+    "requests_per_second": 1 / 3,
+    "max_requests_per_second": 0.5,   # Deflect is touchy, stay close to the old pace
+    "burst": 1,
+    "blocked_wait": 10,   # Deflect is fighting back
+    "max_pages": 50,
+    "max_empty_pages": 3,
+}
+
+SITES = {spec["name"]: spec for spec in (RAPPLER, MINDANEWS, PRESSONE, VERAFILES)}
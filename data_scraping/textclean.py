@@ -0,0 +1,92 @@
+import csv
+import functools
+import glob
+import os
+import re
+import sys
+import time
+import unicodedata
+
+# ==========================================
+# 🧽 TEXT NORMALIZATION STAGE
+# ==========================================
+# What every scraper's clean_text did, done once per site instead of once per
+# call: boilerplate regexes (sites.py "boilerplate") are compiled when the
+# cleaner is built, whitespace is folded with str.split() (same characters as
+# re's \s, no regex engine), and text is Unicode-normalized first (NFC by
+# default, a no-op on text that already is NFC, like all our datasets).
+#
+#   clean = cleaner_for(MINDANEWS["boilerplate"])
+#   clean("MindaNews is the news service arm ...")
+#   clean.many(texts)                     # batch: a list of cleaned texts
+#
+# `python textclean.py` checks the output against the old re.sub version on
+# every *_Full_Dataset.csv and times both.
+
+
+class TextCleaner:
+    def __init__(self, boilerplate=(), unicode_form="NFC"):
+        self.patterns = [re.compile(p, re.IGNORECASE) for p in boilerplate]
+        self.unicode_form = unicode_form
+
+    def __call__(self, text):
+        if not text: return ""
+        form = self.unicode_form
+        if form and not unicodedata.is_normalized(form, text):
+            text = unicodedata.normalize(form, text)
+        for pattern in self.patterns:
+            text = pattern.sub('', text)
+        return " ".join(text.split())
+
+    def many(self, texts):
+        return [self(t) for t in texts]
+
+
+@functools.lru_cache(maxsize=None)
+def _cleaner(boilerplate, unicode_form):
+    return TextCleaner(boilerplate, unicode_form)
+
+
+def cleaner_for(boilerplate=(), unicode_form="NFC"):
+    # One compiled cleaner per site (and per parse process)
+    return _cleaner(tuple(boilerplate), unicode_form)
+
+
+# ==========================================
+# 🔬 EQUIVALENCE CHECK
+# ==========================================
+def legacy_clean(text, boilerplate=()):
+    # The per-call version the scrapers used to have
+    if not text: return ""
+    for pattern in boilerplate:
+        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+if __name__ == "__main__":
+    from sites import SITES
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    texts = []
+    for csv_path in glob.glob(os.path.join(here, "..", "*_Full_Dataset.csv")):
+        with open(csv_path, encoding="utf-8-sig", newline="") as f:
+            texts += [row["text"] for row in csv.DictReader(f)]
+    # Rows are already cleaned; put back the kind of mess raw paragraphs have
+    raw = [t.replace(". ", ".\n\t ", 3) + "   READ ALSO: x\nFollow us on FB" for t in texts]
+    print(f"🧽 {len(raw)} texts")
+
+    bad = 0
+    for name, spec in SITES.items():
+        boilerplate = spec["boilerplate"]
+        clean = cleaner_for(boilerplate)
+        start = time.perf_counter()
+        old = [legacy_clean(t, boilerplate) for t in raw]
+        legacy_time = time.perf_counter() - start
+        start = time.perf_counter()
+        new = clean.many(raw)
+        new_time = time.perf_counter() - start
+        diff = sum(a != b for a, b in zip(old, new))
+        bad += diff
+        print(f"   {'✅' if not diff else '❌'} {name:<12} {diff} differences | "
+              f"re.sub {legacy_time * 1000:.0f} ms -> compiled {new_time * 1000:.0f} ms")
+    sys.exit(1 if bad else 0)
@@ -1,8 +1,18 @@
+import sys
 import time
-import re
-import pandas as pd
 from bs4 import BeautifulSoup
 
+from dedup import UrlIndex
+from linkfilter import LinkClassifier
+from prequal import ShortPages
+from checkpoint import CheckpointStore
+from parsers import extract_text, ARTICLE_CONTAINERS
+from sites import VERAFILES
+from textclean import cleaner_for
+from browser_pool import BrowserPool
+from dataset_writer import DatasetWriter
+from ratelimit import backoff_delay
+
 # Selenium Imports
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -10,49 +20,122 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 
 # ==========================================
 # 👇 CONFIGURATION 👇
 # ==========================================
 TARGET_SAMPLES_PER_CLASS = 3000
+SEEN_URLS_FILE = None  # e.g. "verafiles_seen_urls.txt" to skip articles from earlier runs
+CHECKPOINT_FILE = "verafiles_selenium_checkpoint.jsonl"  # Delete to start from page 1
+BROWSER_POOL_SIZE = 3   # Chrome instances loading articles in parallel (each ~300 MB RAM)
+DRIVER_MAX_USES = 200   # Restart a Chrome after this many articles to keep memory flat
+OUTPUT_FILE = "VeraFiles_Full_Dataset.csv"  # Rows are streamed here as they are accepted
+LINK_CACHE_FILE = "verafiles_selenium_link_rejects.json"  # Listing links already rejected, skipped next time
+SHORT_PAGES_FILE = "verafiles_selenium_short_pages.txt"  # Articles that came out too short, never reloaded
+FAST_MODE = False       # True (or --fast) = headless, eager loads, images/fonts/media and other hosts blocked
 # ==========================================
 
-class VeraFilesScraper:
-    def __init__(self):
-        chrome_options = Options()
-        
+# ⚡ FAST MODE: only these hosts (and their subdomains) resolve; every other
+# request (ads, analytics, embeds, CDNs) fails at DNS inside Chrome
+ALLOWED_HOSTS = [
+    "verafiles.org",
+    "challenges.cloudflare.com",   # The bot check, if the site shows one
+]
+# ...and on those hosts, files the article text never needs (CDP Network.setBlockedURLs)
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.mp4", "*.webm", "*.mp3", "*.woff", "*.woff2", "*.ttf", "*.otf",
+]
+# Article container the page waits on (any of the parser's fallback chain)
+CONTAINER_SELECTOR = ", ".join(f"{tag}.{cls}" if cls else tag for tag, cls in ARTICLE_CONTAINERS["Vera Files"])
+
+def make_driver():
+    chrome_options = Options()
+    
+    if FAST_MODE:
+        # ⚡ HEADLESS: no window, no images, DOMContentLoaded is enough (text is in the HTML)
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--window-size=1366,900")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--mute-audio")
+        # Same-host allowlist; a resolver rule needs no CDP event handling (Fetch.requestPaused)
+        excluded = ", ".join(f"EXCLUDE {host}, EXCLUDE *.{host}" for host in ALLOWED_HOSTS)
+        chrome_options.add_argument(f"--host-resolver-rules=MAP * ~NOTFOUND, {excluded}")
+        chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        chrome_options.page_load_strategy = "eager"
+    else:
         # ⭐ VISUAL MODE (Headless OFF) - Helps bypass detection
         chrome_options.add_argument("--start-maximized") 
-        chrome_options.add_argument("--log-level=3")
-        
-        # ⭐ STEALTH SETTINGS (CRITICAL FOR BYPASSING 403)
-        # 1. Disable the "AutomationControlled" flag
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        
-        # 2. Exclude the "enable-automation" switch
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        
-        # 3. Turn off automation extension
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        # 4. Use a standard User-Agent
-        chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    chrome_options.add_argument("--log-level=3")
+    
+    # ⭐ STEALTH SETTINGS (CRITICAL FOR BYPASSING 403)
+    # 1. Disable the "AutomationControlled" flag
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    
+    # 2. Exclude the "enable-automation" switch
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    
+    # 3. Turn off automation extension
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    
+    # 4. Use a standard User-Agent
+    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
 
-        print("🚀 Initializing Selenium WebDriver (Stealth Mode)...")
-        self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-        
-        # ⭐ CRITICAL: Execute CDP command to completely hide webdriver property
-        self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-            "source": """
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                })
-            """
-        })
-        
+    print(f"🚀 Initializing Selenium WebDriver (Stealth Mode{', headless' if FAST_MODE else ''})...")
+    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+    
+    # ⭐ CRITICAL: Execute CDP command to completely hide webdriver property
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+        "source": """
+            Object.defineProperty(navigator, 'webdriver', {
+                get: () => undefined
+            })
+        """
+    })
+    
+    if FAST_MODE:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+        driver.set_page_load_timeout(60)   # Eager + blocked resources: slow now means stuck
+    else:
         # Long timeout for slow internet
-        self.driver.set_page_load_timeout(180)
+        driver.set_page_load_timeout(180)
+    return driver
+
+# Which <a> on a listing page are articles (see linkfilter.py)
+LINK_RULES = {
+    "name": "Vera Files",
+    "href_contains_any": ["/articles/"],
+    "href_excludes": ["/category/"],
+    "junk_titles": ["methodology", "previous post", "next post", "about us", "contact", "privacy policy"],
+}
+
+def load_article(driver, url):
+    # Runs on a pooled driver. A page-load timeout/crash raises, so the pool recycles that driver
+    driver.get(url)
+    try:
+        # The article container, not just any <p> (nav and cookie banners have those too)
+        WebDriverWait(driver, 15 if FAST_MODE else 30, poll_frequency=0.2).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, CONTAINER_SELECTOR))
+        )
+    except TimeoutException:
+        return None
+    return driver.page_source
+
+class VeraFilesScraper:
+    def __init__(self):
+        # One driver walks the listing pages, the pool loads the articles
+        self.driver = make_driver()
+        self.pool = BrowserPool(make_driver, size=BROWSER_POOL_SIZE, max_uses=DRIVER_MAX_USES)
+        
+        self.seen_urls = UrlIndex(SEEN_URLS_FILE)
+        self.checkpoint = CheckpointStore(CHECKPOINT_FILE)
+        self.links = LinkClassifier(LINK_RULES, cache_path=LINK_CACHE_FILE)
+        self.short_pages = ShortPages(SHORT_PAGES_FILE)
         
         self.urls = {
             "fake": ["https://verafiles.org/articles/category/fact-check"],
@@ -65,63 +148,44 @@ class VeraFilesScraper:
         }
 
     def clean_text(self, text):
-        if not text: return ""
-        return re.sub(r'\s+', ' ', text).strip()
+        return cleaner_for()(text)
 
-    def get_full_content(self, url):
-        try:
-            self.driver.execute_script("window.open('');")
-            self.driver.switch_to.window(self.driver.window_handles[1])
-            
-            text = ""
-            try:
-                self.driver.get(url)
-                WebDriverWait(self.driver, 30).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "p"))
-                )
-                
-                soup = BeautifulSoup(self.driver.page_source, "html.parser")
-                
-                content = soup.find("div", class_="uk-article-content")
-                if not content: content = soup.find("div", class_="entry-content")
-                if not content: content = soup.find("article")
-                
-                if content:
-                    paragraphs = content.find_all('p')
-                    valid_paragraphs = [p.get_text() for p in paragraphs if len(p.get_text()) > 30]
-                    text = self.clean_text(" ".join(valid_paragraphs))
-                
-            except Exception:
-                pass 
-            
-            if len(self.driver.window_handles) > 1:
-                self.driver.close()
-                self.driver.switch_to.window(self.driver.window_handles[0])
-            return text
+    def extract(self, html):
+        if not html: return ""
+        # Only paragraphs longer than 30 chars (lxml backend if installed, see parsers.py)
+        valid_paragraphs = extract_text(html, ARTICLE_CONTAINERS["Vera Files"],
+                                        junk_tags=VERAFILES["junk_tags"], min_paragraph_len=30)
+        return self.clean_text(valid_paragraphs)
 
-        except Exception:
-            if len(self.driver.window_handles) > 1:
-                self.driver.switch_to.window(self.driver.window_handles[0])
-            return ""
+    def get_full_content(self, url):
+        return self.extract(self.pool.run(load_article, url))
 
-    def scroll_to_bottom(self):
+    def scroll_to_bottom(self, timeout=2):
+        # Wait only as long as lazy-loaded content keeps growing the page (was a flat 2 s)
         try:
+            height = self.driver.execute_script("return document.body.scrollHeight")
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(
+                lambda d: d.execute_script("return document.body.scrollHeight") > height
+            )
         except:
             pass
 
-    def scrape_section(self, category_type, target_count):
+    def scrape_section(self, category_type, target_count, sink=None):
         print(f"\n🚀 Starting scrape for '{category_type.upper()}' articles...")
-        collected_data = []
+        restored = self.checkpoint.restore(category_type, self.seen_urls)
+        if sink is not None:
+            sink.write_many(restored)
+        collected = len(restored)
         url_list = self.urls[category_type]
-        junk_titles = ["methodology", "previous post", "next post", "about us", "contact", "privacy policy"]
+        start_index, start_page = self.checkpoint.resume_point(category_type, url_list)
         
-        for base_url in url_list:
-            if len(collected_data) >= target_count: break
+        for source_index, base_url in enumerate(url_list):
+            if source_index < start_index: continue
+            if collected >= target_count: break
             print(f"   👉 Source: {base_url}")
             
-            page_num = 1
+            page_num = start_page if source_index == start_index else 1
             consecutive_empty = 0
             
             # Start navigation
@@ -130,8 +194,9 @@ class VeraFilesScraper:
             else:
                 current_url = f"{base_url}?page={page_num}"
             
-            while len(collected_data) < target_count:
+            while collected < target_count:
                 print(f"      🔄 Navigating to Page {page_num}...")
+                self.checkpoint.record_cursor(category_type, base_url, page_num)
                 
                 # Retry loop
                 success = False
@@ -145,7 +210,7 @@ class VeraFilesScraper:
                         break
                     except Exception:
                         print(f"      ⚠️ Page load failed (Attempt {attempt+1}). Retrying...")
-                        time.sleep(5)
+                        time.sleep(backoff_delay(attempt, base=5))  # 0-5 s, 0-10 s, 0-20 s
                 
                 if not success:
                     print("      ❌ Failed to pass 403 or Timeout. Trying next page...")
@@ -161,38 +226,56 @@ class VeraFilesScraper:
                 all_links = soup.find_all("a", href=True)
                 
                 found_on_page = 0
+                label = "Fake" if category_type == "fake" else "True"
                 
+                # 1. Pick candidate article links from the listing
+                candidates = []
+                page_urls = set()
                 for link in all_links:
-                    if len(collected_data) >= target_count: break
                     href = link['href']
+                    full_url = href if href.startswith("http") else "https://verafiles.org" + href
                     title = link.get_text(strip=True)
+                    if self.links.classify(full_url, title, category_type) is not None:
+                        continue
+
+                    if full_url in self.short_pages:
+                        continue
+                    if full_url not in self.seen_urls and full_url not in page_urls:
+                        page_urls.add(full_url)
+                        candidates.append((full_url, title))
+                
+                # 2. Load them on the browser pool, in parallel
+                results = self.pool.map(load_article, [c[0] for c in candidates])
+                titles = dict(candidates)
+                for full_url, html in results:
+                    if collected >= target_count: break
+                    title = titles[full_url]
+                    text = self.extract(html)
+                    if text: self.seen_urls.add(full_url)
                     
-                    if '/articles/' in href:
-                        full_url = href if href.startswith("http") else "https://verafiles.org" + href
+                    if text and len(text) > 50:
+                        display_title = title if title else full_url.split('/')[-1]
+                        print(f"      ✅ Added: {display_title[:30]}... [{label}]")
                         
-                        is_junk = any(junk in title.lower() for junk in junk_titles)
-                        is_category = '/category/' in full_url
-                        is_duplicate = any(d['url'] == full_url for d in collected_data)
-                        
-                        if not is_junk and not is_category and not is_duplicate:
-                            label = "Fake" if category_type == "fake" else "True"
-                            text = self.get_full_content(full_url)
-                            
-                            if text and len(text) > 50:
-                                display_title = title if title else full_url.split('/')[-1]
-                                print(f"      ✅ Added: {display_title[:30]}... [{label}]")
-                                
-                                collected_data.append({
-                                    "text": text,
-                                    "label": label,
-                                    "category": category_type,
-                                    "title": display_title,
-                                    "url": full_url,
-                                    "source": "Vera Files"
-                                })
-                                found_on_page += 1
+                        row = {
+                            "text": text,
+                            "label": label,
+                            "category": category_type,
+                            "title": display_title,
+                            "url": full_url,
+                            "source": "Vera Files"
+                        }
+                        if sink is not None:
+                            sink.write(row)
+                        self.checkpoint.record_row(category_type, row)
+                        collected += 1
+                        found_on_page += 1
+                    elif text:
+                        self.checkpoint.record_seen(category_type, full_url)
+                        self.short_pages.record(full_url, len(text))
+                results.close()
                 
-                print(f"      📄 Page {page_num}: Found {found_on_page} items. Total: {len(collected_data)}")
+                print(f"      📄 Page {page_num}: Found {found_on_page} items. Total: {collected}")
                 
                 if found_on_page == 0:
                     consecutive_empty += 1
@@ -210,33 +293,36 @@ class VeraFilesScraper:
                 else:
                     current_url = f"{base_url}?page={page_num}"
             
-        return pd.DataFrame(collected_data)
+        self.links.save()
+        print(f"   🔗 Listing links: {self.links.report()}")
+        return collected
 
     def run_full_scrape(self, samples_per_class):
         try:
-            df_fake = self.scrape_section("fake", target_count=samples_per_class)
-            df_true = self.scrape_section("true", target_count=samples_per_class)
+            with DatasetWriter(OUTPUT_FILE) as sink:
+                n_fake = self.scrape_section("fake", target_count=samples_per_class, sink=sink)
+                n_true = self.scrape_section("true", target_count=samples_per_class, sink=sink)
             
             print("\n" + "="*40)
             print(f"📊 FINAL COLLECTION COUNTS:")
-            print(f"   🔴 Fake: {len(df_fake)}")
-            print(f"   🟢 True: {len(df_true)}")
+            print(f"   🔴 Fake: {n_fake}")
+            print(f"   🟢 True: {n_true}")
             print("="*40)
-
-            final_df = pd.concat([df_fake, df_true])
-            final_df.to_csv("VeraFiles_Full_Dataset.csv", index=False, encoding="utf-8-sig")
-            return final_df
+            return {"fake": n_fake, "true": n_true}
         finally:
             try:
                 self.driver.quit()
             except:
                 pass
+            self.pool.close()
 
 if __name__ == "__main__":
+    if "--fast" in sys.argv:
+        FAST_MODE = True
     scraper = VeraFilesScraper()
-    final_dataset = scraper.run_full_scrape(samples_per_class=TARGET_SAMPLES_PER_CLASS)
+    counts = scraper.run_full_scrape(samples_per_class=TARGET_SAMPLES_PER_CLASS)
     
-    if final_dataset is not None and not final_dataset.empty:
-        print(f"\n🎉 SUCCESS! Saved {len(final_dataset)} rows to VeraFiles_Full_Dataset.csv")
+    if sum(counts.values()):
+        print(f"\n🎉 SUCCESS! Saved {sum(counts.values())} rows to {OUTPUT_FILE}")
     else:
         print("\n❌ No data collected.")
\ No newline at end of file
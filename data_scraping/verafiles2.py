@@ -1,174 +1,21 @@
-import cloudscraper
-from bs4 import BeautifulSoup
-import pandas as pd
-import time
-import re
+import sys
+
+from engine import CrawlEngine, run_scraper, site_options
+from sites import VERAFILES
 
 # ==========================================
 # 👇 CONFIGURATION 👇
 # ==========================================
 TARGET_SAMPLES_PER_CLASS = 3000
+OUTPUT_FILE = "VeraFiles_Full_Dataset.csv"  # Shuffled final dataset (.csv / .jsonl / .parquet / .arrow)
+FILE_PREFIX = "verafiles"  # verafiles_checkpoint.jsonl, verafiles_rows.jsonl, ... (engine.site_files)
+OPTIONS = {"max_workers": 2}  # Deflect is touchy; {"client": "browser"} solves it in Chrome
 # ==========================================
 
-class VeraFilesScraper:
-    def __init__(self):
-        # Create a CloudScraper instance to bypass Deflect/Cloudflare
-        self.scraper = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'desktop': True
-            }
-        )
-        self.base_domain = "https://verafiles.org"
-        
-        self.urls = {
-            "fake": ["https://verafiles.org/articles/category/fact-check"],
-            "true": [
-                "https://verafiles.org/articles/category/news",
-                "https://verafiles.org/articles/category/features"
-            ]
-        }
-
-    def get_soup(self, url):
-        for i in range(3):
-            try:
-                # Random sleep to act human
-                time.sleep(3) 
-                
-                # Use self.scraper instead of requests
-                response = self.scraper.get(url, timeout=30)
-                
-                if response.status_code == 200:
-                    return BeautifulSoup(response.text, "html.parser")
-                elif response.status_code == 403:
-                    print(f"      ⚠️  Still getting 403 at {url}. Deflect is fighting back...")
-                    time.sleep(10) # Wait longer if blocked
-                else:
-                    print(f"      ⚠️  Status {response.status_code} at {url}")
-            
-            except Exception as e:
-                print(f"      ❌ Connection Error: {e}")
-                time.sleep(2)
-        return None
-
-    def clean_text(self, text):
-        if not text: return ""
-        text = re.sub(r'VERA FILES', '', text, flags=re.IGNORECASE) 
-        return re.sub(r'\s+', ' ', text).strip()
-
-    def get_full_content(self, url):
-        soup = self.get_soup(url)
-        if not soup: return ""
-        
-        # Vera Files content selectors
-        content = soup.find("div", class_="uk-article-content")
-        if not content: content = soup.find("div", class_="entry-content")
-        if not content: content = soup.find("article")
-        
-        if content:
-            for junk in content.find_all(['script', 'style', 'div.share-bar', 'div.uk-margin-large-top']):
-                junk.decompose()
-            paragraphs = content.find_all('p')
-            return self.clean_text(" ".join([p.get_text() for p in paragraphs]))
-        return ""
-
-    def scrape_section(self, category_type, target_count):
-        print(f"\n🚀 Starting scrape for VERA FILES '{category_type.upper()}'...")
-        collected_data = []
-        url_list = self.urls[category_type]
-        
-        for base_url in url_list:
-            if len(collected_data) >= target_count: break
-            print(f"   👉 Source: {base_url}")
-            page = 1
-            consecutive_empty = 0
-            
-            while len(collected_data) < target_count:
-                # Vera Files pagination uses ?page=X
-                url_to_fetch = base_url if page == 1 else f"{base_url}?page={page}"
-                
-                soup = self.get_soup(url_to_fetch)
-                if not soup: break
-                
-                # Check for the common header types in Vera Files
-                article_headers = soup.find_all("h2", class_="uk-card-title")
-                if not article_headers:
-                    article_headers = soup.find_all("h3", class_="uk-card-title")
-                if not article_headers:
-                    article_headers = soup.find_all("h3") # Fallback
-
-                found_on_page = 0
-                
-                for header in article_headers:
-                    if len(collected_data) >= target_count: break
-                    link = header.find("a", href=True)
-                    if not link: continue
-
-                    href = link['href']
-                    if href.startswith("/"):
-                        href = self.base_domain + href
-                    
-                    title = link.get_text(strip=True)
-                    
-                    # Ensure it is a valid article link
-                    if len(title) > 5 and ("/articles/" in href or "/news/" in href):
-                        if any(d['url'] == href for d in collected_data): continue
-                        
-                        label = "Fake" if category_type == "fake" else "True"
-                        text = self.get_full_content(href)
-                        
-                        if text and len(text) > 100: 
-                            print(f"      ✅ Added: {title[:40]}... [{label}]")
-                            collected_data.append({
-                                "text": text,
-                                "label": label,
-                                "category": category_type,
-                                "title": title,
-                                "url": href,
-                                "source": "Vera Files"
-                            })
-                            found_on_page += 1
-                            time.sleep(1) # Slightly slower to avoid triggering Deflect again
-
-                print(f"      📄 Page {page}: Found {found_on_page} items. (Total: {len(collected_data)}/{target_count})")
-                
-                if found_on_page == 0:
-                    consecutive_empty += 1
-                else:
-                    consecutive_empty = 0
-
-                if consecutive_empty >= 3:
-                    print("      ❌ Source exhausted. Moving to next URL...")
-                    break
-                page += 1
-                if page > 50: break 
-            
-        return pd.DataFrame(collected_data)
-
-    def run_full_scrape(self, samples_per_class):
-        df_fake = self.scrape_section("fake", target_count=samples_per_class)
-        df_true = self.scrape_section("true", target_count=samples_per_class)
-        
-        print("\n" + "="*40)
-        print(f"📊 FINAL VERA FILES COUNTS:")
-        print(f"   🔴 Fake: {len(df_fake)}")
-        print(f"   🟢 True: {len(df_true)}")
-        print("="*40)
-
-        final_df = pd.concat([df_fake, df_true])
-        if not final_df.empty:
-            final_df = final_df.sample(frac=1, random_state=42).reset_index(drop=True)
-        
-        return final_df
+# CloudScraper-based Vera Files crawler; selectors live in sites.VERAFILES
+class VeraFilesScraper(CrawlEngine):
+    def __init__(self, **options):
+        super().__init__(VERAFILES, **site_options(FILE_PREFIX, OPTIONS, options))
 
 if __name__ == "__main__":
-    scraper = VeraFilesScraper()
-    final_dataset = scraper.run_full_scrape(samples_per_class=TARGET_SAMPLES_PER_CLASS)
-    
-    if final_dataset is not None and not final_dataset.empty:
-        filename = "VeraFiles_Full_Dataset.csv"
-        final_dataset.to_csv(filename, index=False, encoding="utf-8-sig")
-        print(f"\n🎉 SUCCESS! Saved {len(final_dataset)} rows to {filename}")
-    else:
-        print("\n❌ No data collected.")
\ No newline at end of file
+    run_scraper(VeraFilesScraper(), FILE_PREFIX, TARGET_SAMPLES_PER_CLASS, OUTPUT_FILE, sys.argv[1:])